@@ -0,0 +1,125 @@
+"""Persistent on-disk cache for video metadata and transcripts."""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+# Cache entries older than this are considered stale (seconds)
+CACHE_TTL = 86400
+
+_cache_lock = threading.Lock()
+
+
+def get_cache_path() -> Path:
+    """Return the default cache file path (~/.cache/ytcapture/meta.json)."""
+    return Path.home() / ".cache" / "ytcapture" / "meta.json"
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    """Load the cache file, returning an empty dict on any error."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {}
+
+
+def _save_cache(path: Path, cache: dict[str, Any]) -> None:
+    """Write the cache file, silently ignoring filesystem errors."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def cache_get(
+    kind: str,
+    video_id: str,
+    ttl: int = CACHE_TTL,
+    path: Path | None = None,
+) -> Any | None:
+    """Look up a cached value for a video.
+
+    Args:
+        kind: Entry category ('metadata' or 'transcript').
+        video_id: YouTube video ID.
+        ttl: Maximum entry age in seconds before it is considered stale.
+        path: Optional cache file path (defaults to ~/.cache/ytcapture/meta.json).
+
+    Returns:
+        The cached value, or None if missing or stale.
+    """
+    cache_path = path or get_cache_path()
+    with _cache_lock:
+        cache = _load_cache(cache_path)
+    entry = cache.get(f"{kind}:{video_id}")
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get("timestamp", 0) > ttl:
+        return None
+    return entry.get("value")
+
+
+def cache_set(
+    kind: str,
+    video_id: str,
+    value: Any,
+    path: Path | None = None,
+) -> None:
+    """Store a value in the cache.
+
+    Args:
+        kind: Entry category ('metadata' or 'transcript').
+        video_id: YouTube video ID.
+        value: JSON-serializable value to store.
+        path: Optional cache file path (defaults to ~/.cache/ytcapture/meta.json).
+    """
+    cache_path = path or get_cache_path()
+    with _cache_lock:
+        cache = _load_cache(cache_path)
+        cache[f"{kind}:{video_id}"] = {
+            "timestamp": time.time(),
+            "value": value,
+        }
+        _save_cache(cache_path, cache)
+
+
+def clear_cache(path: Path | None = None) -> None:
+    """Delete the cache file if it exists."""
+    cache_path = path or get_cache_path()
+    with _cache_lock:
+        cache_path.unlink(missing_ok=True)
+
+
+def cache_command(command: str, args: list[str]) -> int:
+    """Handle the cache subcommand.
+
+    Usage:
+        ytcapture cache clear
+        ytcapture cache path
+
+    Args:
+        command: The command name (ytcapture or vidcapture).
+        args: Arguments after 'cache'.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    if args and args[0] == "clear":
+        clear_cache()
+        print("Cache cleared.", file=sys.stderr)
+        return 0
+
+    if args and args[0] == "path":
+        print(get_cache_path())
+        return 0
+
+    print(f"Usage: {command} cache [clear | path]", file=sys.stderr)
+    return 1
@@ -1,15 +1,21 @@
 """CLI interface for ytcapture and vidcapture."""
 
-import json
+from __future__ import annotations
+
+import errno
+import os
 import platform
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import TYPE_CHECKING, Callable, TypeVar
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from ytcapture import __version__
 from ytcapture.config import (
@@ -18,41 +24,103 @@ from ytcapture.config import (
     get_config_path,
     resolve_output_path,
 )
+from ytcapture.utils import classify_url, extract_video_id, extract_youtube_urls, json_dumps
+
+# Heavy submodules (frames, local, markdown, transcript, video) are imported
+# lazily inside the functions that need them, so --help, --version, and the
+# completion subcommand don't pay their import cost.
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from ytcapture.frames import FrameInfo  # noqa: F401
+    from ytcapture.local import LocalVideoMetadata
+    from ytcapture.transcript import TranscriptSegment
+    from ytcapture.video import VideoMetadata
 
 # Load config at module level for CLI option defaults
 _cfg = get_config_for_defaults()
-from ytcapture.frames import FrameExtractionError, extract_frames_fast, extract_frames_from_file
-from ytcapture.local import LocalVideoError, LocalVideoMetadata, get_local_video_metadata
-from ytcapture.markdown import generate_local_markdown_filename, generate_markdown_file, generate_markdown_filename
-from ytcapture.transcript import TranscriptSegment, get_transcript, save_transcript_json
-from ytcapture.utils import extract_youtube_urls, is_playlist_url, is_video_url
-from ytcapture.video import (
-    VideoError,
-    VideoMetadata,
-    download_video,
-    expand_playlist,
-    get_video_metadata,
-)
+
+# Hardcoded fallbacks for every config-backed CLI default, in one place so
+# the decorator sites can't drift out of sync with each other
+_DEFAULTS = {
+    "interval": 15,
+    "max_frames": None,
+    "frame_format": "jpg",
+    "language": "en",
+    "prefer_manual": False,
+    "dedup_threshold": 0.85,
+    "keep_video": False,
+    "ai_title": True,
+    "concurrency": 4,
+    "fast": True,
+}
+
+
+def cfg_default(key: str):
+    """Return the config value for a CLI option default, or its fallback."""
+    return _cfg.get(key, _DEFAULTS[key])
+
 
 F = TypeVar('F', bound=Callable[..., None])
 
 console = Console()
 
 
-def get_clipboard_urls() -> list[str]:
-    """Check clipboard for YouTube URLs (macOS only).
+@lru_cache(maxsize=1)
+def _have_pbpaste() -> bool:
+    """Check for pbpaste once per process (shutil.which walks $PATH)."""
+    return shutil.which('pbpaste') is not None
 
-    Extracts all YouTube video and playlist URLs from clipboard text,
-    supporting plain URLs, markdown links, CSV, and mixed text formats.
+
+@lru_cache(maxsize=1)
+def _have_mdformat() -> bool:
+    """Check for mdformat once per process (shutil.which walks $PATH)."""
+    return shutil.which('mdformat') is not None
+
+
+@lru_cache(maxsize=1)
+def _mdformat_module():
+    """Import mdformat once per process.
+
+    Python caches successful imports but re-walks sys.path on every failed
+    one, so without this a batch run without mdformat installed would pay
+    the import search once per generated file.
+    """
+    try:
+        import mdformat
+        return mdformat
+    except ImportError:
+        return None
+
+
+# Cached NSPasteboard handle for the AppKit clipboard fast path
+_pasteboard = None
+
+
+def _read_clipboard_text() -> str | None:
+    """Read clipboard text via AppKit when available, else pbpaste.
+
+    The AppKit path avoids a fork/exec per invocation; the pbpaste
+    subprocess is kept as a fallback for environments without pyobjc.
 
     Returns:
-        List of YouTube URLs found in clipboard, empty if none/unavailable.
+        Clipboard text, or None if the clipboard is unavailable.
     """
-    if platform.system() != 'Darwin':
-        return []
+    global _pasteboard
 
-    if shutil.which('pbpaste') is None:
-        return []
+    try:
+        from AppKit import NSPasteboard, NSStringPboardType
+
+        if _pasteboard is None:
+            _pasteboard = NSPasteboard.generalPasteboard()
+        return _pasteboard.stringForType_(NSStringPboardType) or ""
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    if not _have_pbpaste():
+        return None
 
     try:
         result = subprocess.run(
@@ -61,17 +129,106 @@ def get_clipboard_urls() -> list[str]:
             text=True,
             timeout=5,
         )
-        clipboard = result.stdout.strip()
-        if not clipboard:
-            return []
+        return result.stdout
+    except Exception:
+        return None
 
-        return extract_youtube_urls(clipboard)
 
-    except Exception:
+def get_clipboard_urls() -> list[str]:
+    """Check clipboard for YouTube URLs (macOS only).
+
+    Extracts all YouTube video and playlist URLs from clipboard text,
+    supporting plain URLs, markdown links, CSV, and mixed text formats.
+
+    Returns:
+        List of YouTube URLs found in clipboard, empty if none/unavailable.
+    """
+    if platform.system() != 'Darwin':
+        return []
+
+    clipboard = _read_clipboard_text()
+    if not clipboard or not clipboard.strip():
         return []
 
+    return extract_youtube_urls(clipboard.strip())
+
+
+def prefetch_metadata(
+    video_urls: list[str],
+    con: Console,
+    no_cache: bool = False,
+) -> dict[str, VideoMetadata]:
+    """Fetch metadata for a batch of URLs in parallel.
+
+    Consults the on-disk metadata cache first, so a repeated run over the
+    same playlist only fetches the misses, and writes fresh results back
+    so per-video processing (and the next run) hit the cache. The misses
+    are split into small batches, each fetched by a single yt-dlp
+    invocation (amortizing the per-process interpreter startup), and run
+    across a thread pool so a long playlist pays O(N/workers) network
+    latency instead of N serial round trips. URLs whose metadata fetch
+    fails are simply absent from the result; callers fall back to a
+    per-video fetch (and its error reporting).
+
+    Args:
+        video_urls: List of YouTube video URLs.
+        con: Rich Console instance for progress output.
+        no_cache: Bypass the on-disk metadata cache.
+
+    Returns:
+        Dict mapping URL to VideoMetadata for each successful fetch.
+    """
+    from rich.progress import Progress
+
+    from ytcapture.cache import cache_get, cache_set
+    from ytcapture.video import VideoError, VideoMetadata, get_video_metadata_batch
+
+    metas: dict[str, VideoMetadata] = {}
+
+    # Serve cache hits without spawning yt-dlp for them at all
+    to_fetch = video_urls
+    if not no_cache:
+        to_fetch = []
+        for url in video_urls:
+            video_id = extract_video_id(url)
+            cached = cache_get('metadata', video_id) if video_id else None
+            if cached is not None:
+                metas[url] = VideoMetadata(**cached)
+            else:
+                to_fetch.append(url)
 
-def preview_urls(video_urls: list[str], con: Console, source: str = "clipboard") -> bool:
+    if not to_fetch:
+        return metas
+
+    batch_size = 4
+    batches = [to_fetch[i:i + batch_size] for i in range(0, len(to_fetch), batch_size)]
+
+    with Progress(console=con, transient=True) as progress:
+        task = progress.add_task("[bold blue]Fetching video metadata...", total=len(to_fetch))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(get_video_metadata_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    fetched = future.result()
+                except VideoError:
+                    fetched = {}
+                metas.update(fetched)
+                if not no_cache:
+                    for url, meta in fetched.items():
+                        video_id = extract_video_id(url)
+                        if video_id:
+                            cache_set('metadata', video_id, asdict(meta))
+                progress.advance(task, advance=len(batch))
+    return metas
+
+
+def preview_urls(
+    video_urls: list[str],
+    con: Console,
+    source: str = "clipboard",
+    metadata_map: dict[str, VideoMetadata] | None = None,
+) -> bool:
     """Show a preview table of video URLs and optionally prompt for confirmation.
 
     Fetches metadata for each URL and displays a Rich table with title,
@@ -82,12 +239,18 @@ def preview_urls(video_urls: list[str], con: Console, source: str = "clipboard")
         video_urls: List of YouTube video URLs to preview.
         con: Rich Console instance for output.
         source: Input source — "clipboard" (show table + confirm) or "args" (show table only).
+        metadata_map: Prefetched metadata keyed by URL; avoids re-fetching.
 
     Returns:
         True to proceed, False to cancel (only possible for clipboard source).
     """
+    from rich.table import Table
+
     from ytcapture.utils import format_timestamp
 
+    if metadata_map is None:
+        metadata_map = prefetch_metadata(video_urls, con)
+
     title = "Clipboard URLs" if source == "clipboard" else "Input URLs"
     table = Table(title=title)
     table.add_column("#", justify="right", style="dim")
@@ -95,18 +258,17 @@ def preview_urls(video_urls: list[str], con: Console, source: str = "clipboard")
     table.add_column("Channel")
     table.add_column("Duration", justify="right")
 
-    with con.status("[bold blue]Fetching video metadata...", spinner="dots"):
-        for i, url in enumerate(video_urls, 1):
-            try:
-                metadata = get_video_metadata(url)
-                table.add_row(
-                    str(i),
-                    metadata.title,
-                    metadata.channel,
-                    format_timestamp(metadata.duration),
-                )
-            except VideoError:
-                table.add_row(str(i), "(metadata unavailable)", url, "")
+    for i, url in enumerate(video_urls, 1):
+        metadata = metadata_map.get(url)
+        if metadata is not None:
+            table.add_row(
+                str(i),
+                metadata.title,
+                metadata.channel,
+                format_timestamp(metadata.duration),
+            )
+        else:
+            table.add_row(str(i), "(metadata unavailable)", url, "")
 
     con.print()
     con.print(table)
@@ -120,19 +282,32 @@ def preview_urls(video_urls: list[str], con: Console, source: str = "clipboard")
 def format_markdown(filepath: Path) -> bool:
     """Format markdown file with mdformat if available.
 
+    Prefers the in-process mdformat API (no interpreter fork per file);
+    falls back to the mdformat binary when the package isn't importable
+    (e.g. installed standalone via pipx).
+
     Args:
         filepath: Path to the markdown file.
 
     Returns:
         True if formatting was applied, False otherwise.
     """
-    if shutil.which('mdformat') is None:
+    mdformat = _mdformat_module()
+    if mdformat is not None:
+        try:
+            mdformat.file(str(filepath), options={"wrap": "no"})
+            return True
+        except Exception:
+            return False
+
+    if not _have_mdformat():
         return False
 
     try:
         subprocess.run(
             ['mdformat', '--wrap', 'no', filepath],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
         return True
@@ -193,27 +368,27 @@ def common_frame_options(func: F) -> F:
     func = click.option(
         '--interval',
         type=int,
-        default=_cfg.get("interval", 15),
+        default=cfg_default("interval"),
         show_default=True,
         help='Frame extraction interval in seconds',
     )(func)
     func = click.option(
         '--max-frames',
         type=int,
-        default=_cfg.get("max_frames"),
+        default=cfg_default("max_frames"),
         help='Maximum number of frames to extract',
     )(func)
     func = click.option(
         '--frame-format',
         type=click.Choice(['jpg', 'png']),
-        default=_cfg.get("frame_format", "jpg"),
+        default=cfg_default("frame_format"),
         show_default=True,
         help='Frame image format',
     )(func)
     func = click.option(
         '--dedup-threshold',
         type=float,
-        default=_cfg.get("dedup_threshold", 0.85),
+        default=cfg_default("dedup_threshold"),
         show_default=True,
         help='Similarity threshold for frame deduplication (0.0-1.0)',
     )(func)
@@ -230,6 +405,26 @@ def common_frame_options(func: F) -> F:
     return func  # type: ignore[return-value]
 
 
+@contextmanager
+def _stage(description: str, progress: Progress | None, out_console: Console):
+    """Show one processing stage as a spinner or a shared Progress task.
+
+    With a batch-wide Progress instance (concurrent processing), each stage
+    becomes a transient task in the single live region; otherwise it falls
+    back to the per-stage status spinner. Only one Rich Live display can be
+    active at a time, so concurrent workers must share the batch Progress.
+    """
+    if progress is not None:
+        task_id = progress.add_task(f"[bold blue]{description}...", total=None)
+        try:
+            yield
+        finally:
+            progress.remove_task(task_id)
+    else:
+        with out_console.status(f"[bold blue]{description}...", spinner="dots"):
+            yield
+
+
 def process_video(
     url: str,
     output_dir: Path,
@@ -242,6 +437,10 @@ def process_video(
     no_dedup: bool,
     keep_video: bool,
     no_ai_title: bool = False,
+    quiet: bool = False,
+    no_cache: bool = False,
+    prefetched_metadata: VideoMetadata | None = None,
+    progress: Progress | None = None,
 ) -> Path:
     """Process a single video URL.
 
@@ -257,6 +456,12 @@ def process_video(
         no_dedup: Disable frame deduplication.
         keep_video: Keep downloaded video file.
         no_ai_title: Skip AI title generation.
+        quiet: Suppress per-step console output (used for concurrent batches).
+        no_cache: Bypass the on-disk metadata/transcript cache.
+        prefetched_metadata: Metadata fetched earlier in a batch pre-pass;
+            skips the per-video get_video_metadata call when provided.
+        progress: Batch-wide Progress instance; stages render as tasks in
+            its live region instead of per-stage status spinners.
 
     Returns:
         Path to the generated markdown file.
@@ -265,20 +470,41 @@ def process_video(
         VideoError: If video processing fails.
         FrameExtractionError: If frame extraction fails.
     """
-    # 1. Get video metadata
-    with console.status("[bold blue]Fetching video metadata...", spinner="dots"):
-        metadata: VideoMetadata = get_video_metadata(url)
-
-    console.print("[green]✓[/] Fetched video metadata")
-    console.print(f"  [dim]Title:[/] {metadata.title}")
-    console.print(f"  [dim]Channel:[/] {metadata.channel}")
+    from ytcapture.cache import cache_get, cache_set
+    from ytcapture.frames import extract_frames_from_file
+    from ytcapture.markdown import generate_markdown_file, generate_markdown_filename
+    from ytcapture.transcript import TranscriptSegment, get_transcript, save_transcript_json
+    from ytcapture.video import VideoMetadata, download_video, get_video_metadata
+
+    # Use quiet console for concurrent processing
+    out_console = Console(quiet=True) if quiet else console
+
+    # 1. Get video metadata (prefetched, cached, or fetched)
+    cache_video_id = None if no_cache else extract_video_id(url)
+
+    metadata: VideoMetadata | None = prefetched_metadata
+    if metadata is None and cache_video_id:
+        cached_meta = cache_get('metadata', cache_video_id)
+        if cached_meta is not None:
+            metadata = VideoMetadata(**cached_meta)
+            out_console.print("[dim]Using cached metadata[/]")
+
+    if metadata is None:
+        with _stage("Fetching video metadata", progress, out_console):
+            metadata = get_video_metadata(url)
+        if cache_video_id:
+            cache_set('metadata', cache_video_id, asdict(metadata))
+
+    out_console.print("[green]✓[/] Fetched video metadata")
+    out_console.print(f"  [dim]Title:[/] {metadata.title}")
+    out_console.print(f"  [dim]Channel:[/] {metadata.channel}")
 
     # 1b. AI title generation
     if not no_ai_title:
         from ytcapture.titling import generate_ai_title, is_ai_titling_available
 
         if is_ai_titling_available():
-            with console.status("[bold blue]Generating AI title...", spinner="dots"):
+            with _stage("Generating AI title", progress, out_console):
                 result = generate_ai_title(
                     title=metadata.title,
                     channel=metadata.channel,
@@ -287,43 +513,61 @@ def process_video(
             if result.used_ai:
                 metadata._original_title = result.original_title
                 metadata.title = result.ai_title
-                console.print(f"[green]✓[/] AI title: {metadata.title}")
+                out_console.print(f"[green]✓[/] AI title: {metadata.title}")
 
-    # 2. Create directory structure
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # 2. Create per-video frames directory. The shared images/, transcripts/,
+    # and videos/ directories are created once by main(), so only the
+    # per-video path (and videos/, which cleanup may have removed) is probed.
     frames_dir = output_dir / 'images' / metadata.video_id
     frames_dir.mkdir(parents=True, exist_ok=True)
     transcripts_dir = output_dir / 'transcripts'
-    transcripts_dir.mkdir(exist_ok=True)
     videos_dir = output_dir / 'videos'
-    videos_dir.mkdir(exist_ok=True)
-
-    # 3. Get transcript
-    with console.status("[bold blue]Fetching transcript...", spinner="dots"):
-        transcript: list[TranscriptSegment] | None = get_transcript(
-            metadata.video_id,
-            language=language,
-            prefer_manual=prefer_manual,
-        )
+    videos_dir.mkdir(parents=True, exist_ok=True)
+
+    # 3+4. Fetch transcript and download video concurrently — both are
+    # independent network operations, so overlap them in a small pool.
+    transcript: list[TranscriptSegment] | None = None
+    if cache_video_id:
+        cached_transcript = cache_get('transcript', cache_video_id)
+        if cached_transcript is not None:
+            transcript = [TranscriptSegment(**s) for s in cached_transcript]
+            out_console.print("[dim]Using cached transcript[/]")
+
+    if transcript is not None:
+        # Transcript came from cache; only the download remains, so skip
+        # the thread pool and run it directly
+        with _stage("Downloading video", progress, out_console):
+            video_path = download_video(url, videos_dir)
+    else:
+        with _stage("Fetching transcript and downloading video", progress, out_console):
+            with ThreadPoolExecutor(max_workers=2) as stage_pool:
+                transcript_future = stage_pool.submit(
+                    get_transcript,
+                    metadata.video_id,
+                    language=language,
+                    prefer_manual=prefer_manual,
+                )
+                download_future = stage_pool.submit(download_video, url, videos_dir)
+
+                transcript = transcript_future.result()
+                if transcript and cache_video_id:
+                    cache_set('transcript', cache_video_id, [asdict(s) for s in transcript])
+                video_path = download_future.result()
 
     if transcript:
-        console.print(f"[green]✓[/] Found {len(transcript)} transcript segments")
+        out_console.print(f"[green]✓[/] Found {len(transcript)} transcript segments")
         save_transcript_json(
             transcript,
             transcripts_dir / f'raw-transcript-{metadata.video_id}.json',
         )
     else:
-        console.print("[yellow]⚠[/] No transcript available, proceeding with frames only")
-
-    # 4. Download video
-    with console.status("[bold blue]Downloading video...", spinner="dots"):
-        video_path = download_video(url, videos_dir)
+        out_console.print("[yellow]⚠[/] No transcript available, proceeding with frames only")
 
-    video_size = format_size(video_path.stat().st_size)
-    console.print(f"[green]✓[/] Downloaded video ({video_size})")
+    video_size = format_size(os.stat(video_path).st_size)
+    out_console.print(f"[green]✓[/] Downloaded video ({video_size})")
 
     # 5. Extract frames (with integrated dedup)
-    with console.status("[bold blue]Extracting frames...", spinner="dots"):
+    with _stage("Extracting frames", progress, out_console):
         frames = extract_frames_from_file(
             video_path,
             frames_dir,
@@ -334,7 +578,7 @@ def process_video(
         )
 
     dedup_msg = "" if no_dedup else " (deduplicated)"
-    console.print(f"[green]✓[/] Extracted {len(frames)} frames{dedup_msg}")
+    out_console.print(f"[green]✓[/] Extracted {len(frames)} frames{dedup_msg}")
 
     # 6. Handle video file (keep or delete)
     final_video_path: Path | None = None
@@ -345,10 +589,22 @@ def process_video(
         video_ext = video_path.suffix  # .mp4, .webm, etc.
         final_video_path = videos_dir / f'{md_basename}{video_ext}'
 
-        if video_path != final_video_path:
-            video_path.rename(final_video_path)
-
-        console.print(f"  [dim]Video saved:[/] {final_video_path}")
+        if video_path.resolve() != final_video_path.resolve():
+            try:
+                os.replace(video_path, final_video_path)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    # Cross-device rename would silently become a copy;
+                    # keep the file where it landed instead.
+                    out_console.print(
+                        "[yellow]⚠[/] Video is on a different filesystem; "
+                        "keeping original location"
+                    )
+                    final_video_path = video_path
+                else:
+                    raise
+
+        out_console.print(f"  [dim]Video saved:[/] {final_video_path}")
     else:
         try:
             video_path.unlink()
@@ -357,7 +613,7 @@ def process_video(
             pass  # Ignore cleanup errors
 
     # 7. Generate markdown
-    with console.status("[bold blue]Generating markdown...", spinner="dots"):
+    with _stage("Generating markdown", progress, out_console):
         md_file = generate_markdown_file(
             metadata,
             url,
@@ -367,11 +623,11 @@ def process_video(
             video_path=final_video_path,
         )
 
-    console.print("[green]✓[/] Generated markdown")
+    out_console.print("[green]✓[/] Generated markdown")
 
     # 8. Format markdown (if mdformat available)
     if format_markdown(md_file):
-        console.print("  [dim]Formatted with mdformat[/]")
+        out_console.print("  [dim]Formatted with mdformat[/]")
 
     return md_file
 
@@ -386,39 +642,39 @@ def process_video(
 @click.option(
     '--interval',
     type=int,
-    default=_cfg.get("interval", 15),
+    default=cfg_default("interval"),
     show_default=True,
     help='Frame extraction interval in seconds',
 )
 @click.option(
     '--max-frames',
     type=int,
-    default=_cfg.get("max_frames"),
+    default=cfg_default("max_frames"),
     help='Maximum number of frames to extract',
 )
 @click.option(
     '--frame-format',
     type=click.Choice(['jpg', 'png']),
-    default=_cfg.get("frame_format", "jpg"),
+    default=cfg_default("frame_format"),
     show_default=True,
     help='Frame image format',
 )
 @click.option(
     '--language',
-    default=_cfg.get("language", "en"),
+    default=cfg_default("language"),
     show_default=True,
     help='Transcript language code',
 )
 @click.option(
     '--prefer-manual',
     is_flag=True,
-    default=_cfg.get("prefer_manual", False),
+    default=cfg_default("prefer_manual"),
     help='Only use manual transcripts (fail if unavailable)',
 )
 @click.option(
     '--dedup-threshold',
     type=float,
-    default=_cfg.get("dedup_threshold", 0.85),
+    default=cfg_default("dedup_threshold"),
     show_default=True,
     help='Similarity threshold for frame deduplication (0.0-1.0)',
 )
@@ -430,15 +686,27 @@ def process_video(
 @click.option(
     '--keep-video',
     is_flag=True,
-    default=_cfg.get("keep_video", False),
+    default=cfg_default("keep_video"),
     help='Keep downloaded video file after frame extraction',
 )
 @click.option(
     '--no-ai-title',
     is_flag=True,
-    default=not _cfg.get("ai_title", True),
+    default=not cfg_default("ai_title"),
     help='Disable AI title generation (requires anthropic SDK and ANTHROPIC_API_KEY)',
 )
+@click.option(
+    '--concurrency',
+    type=int,
+    default=cfg_default("concurrency"),
+    show_default=True,
+    help='Number of videos to process in parallel (1 = serial)',
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Bypass the on-disk metadata/transcript cache',
+)
 @click.option(
     '-y', '--yes',
     is_flag=True,
@@ -462,6 +730,8 @@ def main(
     no_dedup: bool,
     keep_video: bool,
     no_ai_title: bool,
+    concurrency: int,
+    no_cache: bool,
     yes: bool,
     verbose: bool,
 ) -> None:
@@ -480,6 +750,9 @@ def main(
         ytcapture URL1 URL2 URL3
         ytcapture "https://www.youtube.com/playlist?list=PLAYLIST_ID"
     """
+    from ytcapture.frames import FrameExtractionError
+    from ytcapture.video import VideoError, expand_playlist
+
     # Show message if config was auto-created on this run
     if config_was_auto_created():
         console.print(f"[dim]Created config:[/] {get_config_path()}")
@@ -513,7 +786,8 @@ def main(
     # 3. Classify and expand URLs
     video_urls: list[str] = []
     for url in url_list:
-        if is_playlist_url(url):
+        kind = classify_url(url)
+        if kind == 'playlist':
             console.print(f"\n[dim]Expanding playlist:[/] {url}")
             with console.status("[bold blue]Fetching playlist...", spinner="dots"):
                 try:
@@ -523,7 +797,7 @@ def main(
                     continue
             console.print(f"[green]✓[/] Found {len(playlist_videos)} videos in playlist")
             video_urls.extend(playlist_videos)
-        elif is_video_url(url):
+        elif kind == 'video':
             video_urls.append(url)
         else:
             console.print(f"[yellow]⚠[/] Skipping invalid URL: {url}")
@@ -531,18 +805,29 @@ def main(
     if not video_urls:
         raise click.ClickException("No valid video URLs found.")
 
-    # 4. Deduplicate video URLs
-    seen: set[str] = set()
-    unique_urls: list[str] = []
-    for url in video_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
-    video_urls = unique_urls
+    # 4. Deduplicate video URLs (dict.fromkeys preserves order)
+    video_urls = list(dict.fromkeys(video_urls))
+
+    # Create shared subdirectories once, instead of per video — only now
+    # that at least one URL validated, so a bad invocation leaves no
+    # empty directories behind
+    (output_dir / 'images').mkdir(parents=True, exist_ok=True)
+    (output_dir / 'transcripts').mkdir(exist_ok=True)
+    (output_dir / 'videos').mkdir(exist_ok=True)
+
+    # 5. Prefetch metadata for multi-video batches (parallel pre-pass)
+    prefetched: dict[str, VideoMetadata] = {}
+    if len(video_urls) > 1:
+        prefetched = prefetch_metadata(video_urls, console, no_cache=no_cache)
 
-    # 5. Preview URLs (multi-URL: always show table; clipboard: also confirm)
+    # 5b. Preview URLs (multi-URL: always show table; clipboard: also confirm)
     if len(video_urls) > 1 and not yes:
-        if not preview_urls(video_urls, console, source="clipboard" if from_clipboard else "args"):
+        if not preview_urls(
+            video_urls,
+            console,
+            source="clipboard" if from_clipboard else "args",
+            metadata_map=prefetched,
+        ):
             raise click.ClickException("Cancelled by user.")
 
     # 6. Confirm if >10 videos (unless -y/--yes)
@@ -551,33 +836,92 @@ def main(
         if not click.confirm("Continue?", default=True):
             raise click.ClickException("Cancelled by user.")
 
-    # 7. Process each video
+    # 7. Process each video (in parallel when concurrency > 1)
     console.print(f"\n[bold]Processing {len(video_urls)} video(s)...[/]\n")
 
     success_count = 0
     error_count = 0
 
-    for i, video_url in enumerate(video_urls, 1):
-        console.print(f"[bold blue][{i}/{len(video_urls)}][/] {video_url}")
-        try:
-            md_file = process_video(
-                video_url,
-                output_dir,
-                interval,
-                max_frames,
-                frame_format,
-                language,
-                prefer_manual,
-                dedup_threshold,
-                no_dedup,
-                keep_video,
-                no_ai_title,
-            )
-            console.print(f"[green]✓[/] {md_file.name}")
-            success_count += 1
-        except (VideoError, FrameExtractionError) as e:
-            console.print(f"[red]✗[/] Failed: {e}")
-            error_count += 1
+    if concurrency > 1 and len(video_urls) > 1:
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
+        # Worker threads run quietly (no per-step status spinners); their
+        # stages appear as tasks in one shared Progress live region, and
+        # results are reported from the main thread as each video completes.
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            batch_task = progress.add_task("[bold]Videos", total=len(video_urls))
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(
+                        process_video,
+                        video_url,
+                        output_dir,
+                        interval,
+                        max_frames,
+                        frame_format,
+                        language,
+                        prefer_manual,
+                        dedup_threshold,
+                        no_dedup,
+                        keep_video,
+                        no_ai_title,
+                        True,  # quiet
+                        no_cache,
+                        prefetched.get(video_url),
+                        progress,
+                    ): video_url
+                    for video_url in video_urls
+                }
+                completed = 0
+                for future in as_completed(futures):
+                    video_url = futures[future]
+                    completed += 1
+                    prefix = f"[bold blue][{completed}/{len(video_urls)}][/]"
+                    try:
+                        md_file = future.result()
+                        console.print(f"{prefix} [green]✓[/] {md_file.name}")
+                        success_count += 1
+                    except (VideoError, FrameExtractionError) as e:
+                        console.print(f"{prefix} [red]✗[/] {video_url}: {e}")
+                        error_count += 1
+                    progress.advance(batch_task)
+    else:
+        for i, video_url in enumerate(video_urls, 1):
+            console.print(f"[bold blue][{i}/{len(video_urls)}][/] {video_url}")
+            try:
+                md_file = process_video(
+                    video_url,
+                    output_dir,
+                    interval,
+                    max_frames,
+                    frame_format,
+                    language,
+                    prefer_manual,
+                    dedup_threshold,
+                    no_dedup,
+                    keep_video,
+                    no_ai_title,
+                    no_cache=no_cache,
+                    prefetched_metadata=prefetched.get(video_url),
+                )
+                console.print(f"[green]✓[/] {md_file.name}")
+                success_count += 1
+            except (VideoError, FrameExtractionError) as e:
+                console.print(f"[red]✗[/] Failed: {e}")
+                error_count += 1
 
     # 8. Summary
     if error_count > 0:
@@ -597,8 +941,11 @@ def process_local_video(
     dedup_threshold: float,
     no_dedup: bool,
     fast: bool = False,
+    auto_fast: bool = False,
     json_output: bool = False,
     force: bool = False,
+    quiet: bool = False,
+    stat_result: os.stat_result | None = None,
 ) -> dict | Path:
     """Process a single local video file.
 
@@ -611,8 +958,13 @@ def process_local_video(
         dedup_threshold: Similarity threshold for frame deduplication.
         no_dedup: Disable frame deduplication.
         fast: Use fast keyframe-seeking extraction (less accurate timestamps).
+        auto_fast: Allow promoting to fast extraction for long videos with
+            sparse sampling (set when --no-fast was not given explicitly).
         json_output: If True, return dict instead of Path and suppress console output.
         force: If True, overwrite existing output files without prompting.
+        quiet: Suppress per-step console output (used for concurrent batches).
+        stat_result: Pre-computed os.stat result from batch validation;
+            avoids re-statting the file.
 
     Returns:
         Path to the generated markdown file, or dict with status/metadata if json_output.
@@ -621,17 +973,31 @@ def process_local_video(
         LocalVideoError: If video processing fails.
         FrameExtractionError: If frame extraction fails.
     """
-    # Use quiet console for JSON output
-    out_console = Console(quiet=True) if json_output else console
+    from ytcapture.frames import extract_frames_fast, extract_frames_from_file
+    from ytcapture.local import LocalVideoError, get_local_video_metadata
+    from ytcapture.markdown import generate_local_markdown_filename, generate_markdown_file
+
+    # Use quiet console for JSON output or concurrent processing
+    out_console = Console(quiet=True) if (json_output or quiet) else console
 
     # 1. Get video metadata
     with out_console.status("[bold blue]Extracting video metadata...", spinner="dots"):
-        metadata: LocalVideoMetadata = get_local_video_metadata(video_path)
+        metadata: LocalVideoMetadata = get_local_video_metadata(video_path, stat_result=stat_result)
 
     out_console.print("[green]✓[/] Extracted video metadata")
     out_console.print(f"  [dim]Title:[/] {metadata.title}")
     out_console.print(f"  [dim]Duration:[/] {metadata.duration:.1f}s")
 
+    # Auto-promote sparse sampling on long videos to keyframe seeking;
+    # full decode wastes most of its work when >60 sample points are
+    # spread across the video. Explicit --no-fast still forces full decode.
+    if auto_fast and not fast and interval > 0 and metadata.duration / interval > 60:
+        fast = True
+        out_console.print(
+            "[dim]Long video with sparse sampling; using fast keyframe seeking "
+            "(pass --no-fast to force full decode)[/]"
+        )
+
     # Check if output file already exists
     md_filename = generate_local_markdown_filename(metadata)
     md_filepath = output_dir / md_filename
@@ -642,6 +1008,12 @@ def process_local_video(
                 "video": str(video_path.resolve()),
                 "error": f"Output file exists: {md_filename}. Use -f/--force to overwrite.",
             }
+        if quiet:
+            # Concurrent worker: no stdin prompts here (the batch driver
+            # resolves overwrites up front); surface as a per-file error
+            raise LocalVideoError(
+                f"Output file exists: {md_filename}. Use -f/--force to overwrite."
+            )
         if not click.confirm(f"Output file exists: {md_filename}\nOverwrite?", default=False):
             raise click.ClickException("Output file exists. Use -f/--force to overwrite.")
 
@@ -649,9 +1021,11 @@ def process_local_video(
     output_dir.mkdir(parents=True, exist_ok=True)
     frames_dir = output_dir / 'images' / metadata.identifier
     if frames_dir.exists():
-        # Find next available suffix
+        # Find next available suffix — list images/ once instead of
+        # stat-probing each candidate name
+        existing = {entry.name for entry in os.scandir(output_dir / 'images')}
         suffix = 2
-        while (output_dir / 'images' / f"{metadata.file_path.stem}-{suffix}").exists():
+        while f"{metadata.file_path.stem}-{suffix}" in existing:
             suffix += 1
         metadata._identifier_suffix = suffix
         frames_dir = output_dir / 'images' / metadata.identifier
@@ -670,6 +1044,7 @@ def process_local_video(
                 max_frames=max_frames,
                 frame_format=frame_format,
                 dedup_threshold=None if no_dedup else dedup_threshold,
+                dedup_algo='ahash',
             )
         else:
             frames = extract_frames_from_file(
@@ -679,6 +1054,7 @@ def process_local_video(
                 max_frames=max_frames,
                 frame_format=frame_format,
                 dedup_threshold=None if no_dedup else dedup_threshold,
+                dedup_algo='ahash',
             )
 
     dedup_msg = "" if no_dedup else " (deduplicated)"
@@ -715,11 +1091,11 @@ def process_local_video(
 
 
 @click.command(context_settings={'help_option_names': ['-h', '--help']})
-@click.argument('files', nargs=-1, type=click.Path(exists=True))
+@click.argument('files', nargs=-1, type=click.Path())
 @common_frame_options
 @click.option(
     '--fast/--no-fast',
-    default=_cfg.get("fast", True),
+    default=cfg_default("fast"),
     show_default=True,
     help='Use fast keyframe seeking (--no-fast for full decode)',
 )
@@ -729,11 +1105,23 @@ def process_local_video(
     is_flag=True,
     help='Output JSON instead of rich console output (for programmatic use)',
 )
+@click.option(
+    '--json-lines',
+    is_flag=True,
+    help='Stream one JSON object per file as it completes (NDJSON)',
+)
 @click.option(
     '-f', '--force',
     is_flag=True,
     help='Overwrite existing output files without prompting',
 )
+@click.option(
+    '--concurrency',
+    type=int,
+    default=cfg_default("concurrency"),
+    show_default=True,
+    help='Number of videos to process in parallel (1 = serial)',
+)
 @click.version_option(version=__version__)
 def vidcapture_main(
     files: tuple[str, ...],
@@ -746,7 +1134,9 @@ def vidcapture_main(
     verbose: bool,
     fast: bool,
     json_output: bool,
+    json_lines: bool,
     force: bool,
+    concurrency: int,
 ) -> None:
     """Extract frames from local video files.
 
@@ -762,6 +1152,19 @@ def vidcapture_main(
         vidcapture recording.mov --interval 30 --max-frames 50
         vidcapture long-workshop.mp4 --no-fast --interval 60
     """
+    from ytcapture.frames import FrameExtractionError
+    from ytcapture.local import LocalVideoError
+
+    # --json-lines implies machine-readable output per file
+    json_output = json_output or json_lines
+
+    # Long videos with sparse sampling may be promoted to fast keyframe
+    # seeking, but only when --fast/--no-fast wasn't given on the CLI
+    auto_fast = (
+        click.get_current_context().get_parameter_source('fast')
+        != click.core.ParameterSource.COMMANDLINE
+    )
+
     # Use quiet console for JSON output
     out_console = Console(quiet=True) if json_output else console
 
@@ -771,12 +1174,29 @@ def vidcapture_main(
 
     if not files:
         if json_output:
-            print(json.dumps({"status": "error", "error": "No video files provided"}))
+            print(json_dumps({"status": "error", "error": "No video files provided"}))
             return
         raise click.ClickException(
             "No video files provided. Pass paths to video files as arguments."
         )
 
+    # Validate all input files in one pass (a single stat each), reporting
+    # every missing file at once instead of failing on the first
+    paths = [Path(f) for f in files]
+    stats: dict[Path, os.stat_result] = {}
+    missing: list[Path] = []
+    for p in paths:
+        try:
+            stats[p] = p.stat()
+        except OSError:
+            missing.append(p)
+    if missing:
+        message = f"File(s) not found: {', '.join(str(p) for p in missing)}"
+        if json_output:
+            print(json_dumps({"status": "error", "error": message}))
+            return
+        raise click.ClickException(message)
+
     # Determine output directory
     if output:
         output_dir = resolve_output_path(output)
@@ -793,45 +1213,136 @@ def vidcapture_main(
     error_count = 0
     results: list[dict] = []
 
-    for i, file_path in enumerate(files, 1):
-        video_path = Path(file_path)
-        out_console.print(f"[bold blue][{i}/{len(files)}][/] {video_path.name}")
-        try:
-            result = process_local_video(
-                video_path,
-                output_dir,
-                interval,
-                max_frames,
-                frame_format,
-                dedup_threshold,
-                no_dedup,
-                fast,
-                json_output,
-                force,
+    if concurrency > 1 and len(files) > 1:
+        # Resolve overwrite prompts in the main thread before submitting:
+        # workers must never touch stdin (several could prompt at once),
+        # and a declined prompt raises ClickException, which the per-file
+        # error handling below does not cover. The output name is purely
+        # stem-based here — collision suffixes are only added later, after
+        # process_local_video runs this same check.
+        force_flags: dict[Path, bool] = {}
+        skipped: list[Path] = []
+        for video_path in paths:
+            per_file_force = force
+            if not force and not json_output:
+                candidate = output_dir / f'{video_path.stem}.md'
+                if candidate.exists():
+                    if click.confirm(
+                        f"Output file exists: {candidate.name}\nOverwrite?", default=False
+                    ):
+                        per_file_force = True
+                    else:
+                        skipped.append(video_path)
+                        continue
+            force_flags[video_path] = per_file_force
+
+        for video_path in skipped:
+            out_console.print(
+                f"[yellow]⚠[/] Skipped {video_path.name}: output file exists "
+                "(use -f/--force to overwrite)"
             )
-            if json_output:
-                results.append(result)  # type: ignore[arg-type]
-            else:
-                out_console.print(f"[green]✓[/] {result.name}")  # type: ignore[union-attr]
-            success_count += 1
-        except (LocalVideoError, FrameExtractionError) as e:
-            if json_output:
-                results.append({
+            error_count += 1
+
+        # Worker threads run quietly; results are collected in input order
+        # for JSON output and reported as each file completes.
+        ordered_results: dict[int, dict] = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(
+                    process_local_video,
+                    video_path,
+                    output_dir,
+                    interval,
+                    max_frames,
+                    frame_format,
+                    dedup_threshold,
+                    no_dedup,
+                    fast,
+                    auto_fast,
+                    json_output,
+                    force_flags[video_path],
+                    True,  # quiet
+                    stats[video_path],
+                ): (i, video_path)
+                for i, video_path in enumerate(paths)
+                if video_path in force_flags
+            }
+            completed = 0
+            for future in as_completed(futures):
+                i, video_path = futures[future]
+                completed += 1
+                prefix = f"[bold blue][{completed}/{len(files)}][/]"
+                try:
+                    result = future.result()
+                    if json_lines:
+                        print(json_dumps(result), flush=True)
+                    elif json_output:
+                        ordered_results[i] = result  # type: ignore[assignment]
+                    else:
+                        out_console.print(f"{prefix} [green]✓[/] {result.name}")  # type: ignore[union-attr]
+                    success_count += 1
+                except (LocalVideoError, FrameExtractionError) as e:
+                    error_result = {
+                        "status": "error",
+                        "video": str(video_path.resolve()),
+                        "error": str(e),
+                    }
+                    if json_lines:
+                        print(json_dumps(error_result), flush=True)
+                    elif json_output:
+                        ordered_results[i] = error_result
+                    else:
+                        out_console.print(f"{prefix} [red]✗[/] {video_path.name}: {e}")
+                    error_count += 1
+        results = [ordered_results[i] for i in sorted(ordered_results)]
+    else:
+        for i, video_path in enumerate(paths, 1):
+            out_console.print(f"[bold blue][{i}/{len(files)}][/] {video_path.name}")
+            try:
+                result = process_local_video(
+                    video_path,
+                    output_dir,
+                    interval,
+                    max_frames,
+                    frame_format,
+                    dedup_threshold,
+                    no_dedup,
+                    fast,
+                    auto_fast,
+                    json_output,
+                    force,
+                    stat_result=stats[video_path],
+                )
+                if json_lines:
+                    print(json_dumps(result), flush=True)
+                elif json_output:
+                    results.append(result)  # type: ignore[arg-type]
+                else:
+                    out_console.print(f"[green]✓[/] {result.name}")  # type: ignore[union-attr]
+                success_count += 1
+            except (LocalVideoError, FrameExtractionError) as e:
+                error_result = {
                     "status": "error",
                     "video": str(video_path.resolve()),
                     "error": str(e),
-                })
-            else:
-                out_console.print(f"[red]✗[/] Failed: {e}")
-            error_count += 1
-
-    # JSON output
+                }
+                if json_lines:
+                    print(json_dumps(error_result), flush=True)
+                elif json_output:
+                    results.append(error_result)
+                else:
+                    out_console.print(f"[red]✗[/] Failed: {e}")
+                error_count += 1
+
+    # JSON output (per-file lines were already streamed for --json-lines)
+    if json_lines:
+        return
     if json_output:
         # Single file: return single result; multiple files: return array
         if len(files) == 1:
-            print(json.dumps(results[0], indent=2))
+            print(json_dumps(results[0], indent=True))
         else:
-            print(json.dumps({
+            print(json_dumps({
                 "status": "success" if error_count == 0 else "partial",
                 "succeeded": success_count,
                 "failed": error_count,
@@ -848,41 +1359,5 @@ def vidcapture_main(
         out_console.print(f"\n[bold green]Complete![/] {success_count} video(s) processed")
 
 
-def ytcapture_entry() -> None:
-    """Entry point for ytcapture command.
-
-    Handles completion subcommand before Click processing.
-
-    Shell completion:
-        ytcapture completion bash            Output completion script
-        ytcapture completion bash --install  Install to user completions directory
-    """
-    import sys
-
-    if len(sys.argv) > 1 and sys.argv[1] == "completion":
-        from ytcapture.completion import completion_command
-
-        sys.exit(completion_command("ytcapture", sys.argv[2:]))
-    main()
-
-
-def vidcapture_entry() -> None:
-    """Entry point for vidcapture command.
-
-    Handles completion subcommand before Click processing.
-
-    Shell completion:
-        vidcapture completion bash            Output completion script
-        vidcapture completion bash --install  Install to user completions directory
-    """
-    import sys
-
-    if len(sys.argv) > 1 and sys.argv[1] == "completion":
-        from ytcapture.completion import completion_command
-
-        sys.exit(completion_command("vidcapture", sys.argv[2:]))
-    vidcapture_main()
-
-
 if __name__ == '__main__':
     main()
@@ -1,10 +1,13 @@
 """Shell completion script generation and installation."""
 
+import os
 import sys
+from functools import lru_cache
 from importlib.resources import as_file, files
 from pathlib import Path
 
 
+@lru_cache(maxsize=4)
 def get_completion_path(command: str) -> Path:
     """Return the user-level bash completion installation path.
 
@@ -17,6 +20,7 @@ def get_completion_path(command: str) -> Path:
     return Path.home() / ".local/share/bash-completion/completions" / command
 
 
+@lru_cache(maxsize=4)
 def get_bash_script_source(command: str) -> Path:
     """Return the path to the bash completion script in the package.
 
@@ -32,6 +36,7 @@ def get_bash_script_source(command: str) -> Path:
         return Path(path).resolve()
 
 
+@lru_cache(maxsize=4)
 def get_bash_completion_script(command: str) -> str:
     """Return the bash completion script content.
 
@@ -73,13 +78,15 @@ def completion_command(command: str, args: list[str]) -> int:
         dest = get_completion_path(command)
         dest.parent.mkdir(parents=True, exist_ok=True)
 
-        # Remove existing file/symlink
-        if dest.exists() or dest.is_symlink():
-            dest.unlink()
-
-        # Create symlink to source file
+        # Create the symlink at a temp name and rename it into place:
+        # atomic replacement of any existing install, with no window
+        # where the completion file is missing
         source = get_bash_script_source(command)
-        dest.symlink_to(source)
+        tmp = dest.with_name(dest.name + ".tmp")
+        if tmp.is_symlink() or tmp.exists():
+            tmp.unlink()
+        os.symlink(source, tmp)
+        os.replace(tmp, dest)
         print(f"Installed: {dest} -> {source}", file=sys.stderr)
         print("Restart your shell or run: source ~/.bashrc", file=sys.stderr)
         return 0
@@ -1,10 +1,21 @@
 """Configuration file handling for ytcapture/vidcapture."""
 
+import os
+import pickle
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml C parser; falls back to the pure-Python state machine when
+    # PyYAML was built without it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 # Default configuration values
 DEFAULT_CONFIG: dict[str, Any] = {
@@ -12,6 +23,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "max_frames": None,
     "frame_format": "jpg",
     "dedup_threshold": 0.85,
+    "concurrency": 4,
     # ytcapture-specific
     "language": "en",
     "prefer_manual": False,
@@ -34,6 +46,7 @@ interval: 15           # Seconds between frames [15]
 # max_frames:          # Maximum frames to extract [none - no limit]
 frame_format: jpg      # jpg or png [jpg]
 dedup_threshold: 0.85  # 0.0-1.0, higher = more aggressive dedup [0.85]
+concurrency: 4         # Parallel workers for multi-video batches (1 = serial) [4]
 
 # ytcapture-specific defaults (YouTube video processing)
 language: en           # Transcript language code [en]
@@ -89,12 +102,12 @@ def load_config(path: Path | None = None) -> tuple[dict[str, Any], bool]:
 
     try:
         with open(config_path, encoding="utf-8") as f:
-            file_config = yaml.safe_load(f) or {}
+            file_config = yaml.load(f, Loader=_YamlLoader) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in config file {config_path}: {e}") from e
 
     # Merge file config into defaults
-    config = _merge_dicts(config, file_config)
+    config = _merge_flat(config, file_config)
 
     return config, was_created
 
@@ -106,7 +119,19 @@ def merge_config(
 
     CLI overrides take precedence over file config.
     """
-    return _merge_dicts(file_config, cli_overrides)
+    return _merge_flat(file_config, cli_overrides)
+
+
+def _merge_flat(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Shallow merge two dictionaries. Override values take precedence.
+
+    The config schema is flat (no nested dicts), so plain dict.update
+    replaces the recursive walk and per-key isinstance checks of
+    _merge_dicts on every config load.
+    """
+    result = base.copy()
+    result.update(override)
+    return result
 
 
 def _merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
@@ -142,12 +167,65 @@ def resolve_output_path(folder: str) -> Path:
     return output_path
 
 
-# Module-level cached config for CLI defaults
-_cached_config: dict[str, Any] | None = None
+def _pickle_cache_path() -> Path:
+    """Return the path of the parsed-config pickle cache."""
+    return Path.home() / ".cache" / "ytcapture" / "config.pkl"
+
+
+def _parse_config_file(config_path: Path) -> dict[str, Any]:
+    """Parse the YAML config, consulting a pickle side-cache.
+
+    The cache is keyed on the config file's (mtime_ns, size); unpickling
+    the parsed dict skips the PyYAML parse on every CLI startup for a file
+    that essentially never changes. Any cache error falls back silently to
+    a fresh parse.
+
+    Args:
+        config_path: Path to the YAML config file.
+
+    Returns:
+        Parsed config dict (file values only, not merged with defaults).
+    """
+    try:
+        st = config_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    cache_path = _pickle_cache_path()
+    if key is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached_config = pickle.load(f)
+            if cached_key == key:
+                return cached_config
+        except Exception:
+            pass
+
+    with open(config_path, encoding="utf-8") as f:
+        file_config = yaml.load(f, Loader=_YamlLoader) or {}
+
+    if key is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, file_config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
+    return file_config
+
+
+# Module-level cached config for CLI defaults. Stored as a read-only
+# MappingProxyType so callers can share the one merged dict without
+# defensive copies (mutating it would silently change CLI defaults).
+_cached_config: Mapping[str, Any] | None = None
 _config_was_created: bool = False
 
 
-def get_config_for_defaults() -> dict[str, Any]:
+def get_config_for_defaults() -> Mapping[str, Any]:
     """Load config once and cache for CLI option defaults.
 
     This function is designed to be called at module import time
@@ -155,7 +233,8 @@ def get_config_for_defaults() -> dict[str, Any]:
     creates the config file if missing, without printing messages.
 
     Returns:
-        Config dict with all settings (file values merged over defaults).
+        Read-only config mapping with all settings (file values merged
+        over defaults).
     """
     global _cached_config, _config_was_created
 
@@ -163,7 +242,7 @@ def get_config_for_defaults() -> dict[str, Any]:
         config_path = get_config_path()
 
         # Start with defaults
-        _cached_config = DEFAULT_CONFIG.copy()
+        merged = DEFAULT_CONFIG.copy()
 
         if not config_path.exists():
             # Auto-create config file silently
@@ -171,13 +250,14 @@ def get_config_for_defaults() -> dict[str, Any]:
             _config_was_created = True
         else:
             try:
-                with open(config_path, encoding="utf-8") as f:
-                    file_config = yaml.safe_load(f) or {}
-                _cached_config = _merge_dicts(_cached_config, file_config)
+                file_config = _parse_config_file(config_path)
+                merged = _merge_flat(merged, file_config)
             except (yaml.YAMLError, OSError):
                 # On error, just use defaults
                 pass
 
+        _cached_config = MappingProxyType(merged)
+
     return _cached_config
 
 
@@ -0,0 +1,56 @@
+"""Console-script entry shims for ytcapture and vidcapture.
+
+This module deliberately imports nothing heavy at module scope: the
+completion subcommand is dispatched from argv before ytcapture.cli (and
+its click/rich/config machinery) is imported, keeping shell tab-complete
+invocations fast.
+"""
+
+import sys
+
+
+def ytcapture_entry() -> None:
+    """Entry point for ytcapture command.
+
+    Handles completion and cache subcommands before Click processing.
+
+    Shell completion:
+        ytcapture completion bash            Output completion script
+        ytcapture completion bash --install  Install to user completions directory
+
+    Cache maintenance:
+        ytcapture cache clear                Delete the metadata/transcript cache
+        ytcapture cache path                 Print the cache file path
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "completion":
+        from ytcapture.completion import completion_command
+
+        sys.exit(completion_command("ytcapture", sys.argv[2:]))
+
+    if len(sys.argv) > 1 and sys.argv[1] == "cache":
+        from ytcapture.cache import cache_command
+
+        sys.exit(cache_command("ytcapture", sys.argv[2:]))
+
+    from ytcapture.cli import main
+
+    main()
+
+
+def vidcapture_entry() -> None:
+    """Entry point for vidcapture command.
+
+    Handles completion subcommand before Click processing.
+
+    Shell completion:
+        vidcapture completion bash            Output completion script
+        vidcapture completion bash --install  Install to user completions directory
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == "completion":
+        from ytcapture.completion import completion_command
+
+        sys.exit(completion_command("vidcapture", sys.argv[2:]))
+
+    from ytcapture.cli import vidcapture_main
+
+    vidcapture_main()
@@ -1,13 +1,41 @@
 """Frame extraction from local video files using ffmpeg."""
 
+import hashlib
+import io
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-import imagehash
+import numpy as np
 from PIL import Image
+from scipy.fft import dct
+
+# pHash parameters: DCT over a 32x32 grayscale image, keep the top-left
+# 8x8 low-frequency block -> 64-bit hash
+_PHASH_DCT_SIZE = 32
+_PHASH_HASH_SIZE = 8
+
+# Orthonormal DCT-II basis for the fixed 32x32 input: the 2-D DCT reduces
+# to two small matmuls (_DCT32 @ X @ _DCT32.T), which hit BLAS kernels and
+# skip pocketfft plan setup on every frame
+_DCT32 = dct(np.eye(_PHASH_DCT_SIZE, dtype=np.float32), type=2, norm='ortho', axis=0)
+
+# Seek points per ffmpeg invocation in extract_frames_fast; batching
+# amortizes process-spawn overhead while keeping command lines bounded
+_SEEK_BATCH_SIZE = 16
+
+# Bytes hashed for the exact-duplicate short-circuit: same encoder, same
+# input, so byte-identical frames agree on size and leading bytes
+_EXACT_DUP_HEAD_BYTES = 4096
+
+# Per-byte popcount lookup table for vectorized Hamming distances; an
+# 8-entry gather per hash beats unpacking all 64 bits
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
 
 
 @dataclass
@@ -16,6 +44,10 @@ class FrameInfo:
 
     path: Path
     timestamp: float
+    # pHash computed during extraction, so consumers never need to re-read
+    # and re-decode the frame file to fingerprint it (None if hashing was
+    # disabled or failed)
+    phash: int | None = None
 
 
 class FrameExtractionError(Exception):
@@ -33,31 +65,356 @@ def check_ffmpeg() -> bool:
     return shutil.which('ffmpeg') is not None
 
 
-def compute_phash(image_path: Path) -> imagehash.ImageHash:
-    """Compute perceptual hash for an image.
+def compute_phash(image_path: Path | str, algo: str = 'phash') -> int:
+    """Compute a 64-bit perceptual hash for an image file.
+
+    Uses the vectorized NumPy path, so no per-pixel Python work happens
+    on this per-frame path.
 
     Args:
         image_path: Path to the image file.
+        algo: Hash algorithm, 'phash' (DCT) or 'ahash' (mean threshold).
 
     Returns:
-        Perceptual hash of the image.
+        64-bit hash fingerprint.
+    """
+    return int(_hash_batch(_load_phash_input(image_path)[np.newaxis], algo)[0])
+
+
+def _phash_input(image: Image.Image) -> np.ndarray:
+    """Convert an image to the (32, 32) float32 grayscale pHash input."""
+    size = (_PHASH_DCT_SIZE, _PHASH_DCT_SIZE)
+    return np.asarray(image.convert('L').resize(size, Image.BILINEAR), dtype=np.float32)
+
+
+def _head_digest(image_path: Path | str) -> bytes:
+    """Digest the first few KB of a file for exact-duplicate detection."""
+    with open(image_path, 'rb') as f:
+        return hashlib.blake2b(f.read(_EXACT_DUP_HEAD_BYTES), digest_size=8).digest()
+
+
+def _load_phash_input(image_path: Path | str) -> np.ndarray:
+    """Decode an image file to its pHash input array.
+
+    For JPEG frames, draft mode asks libjpeg to decode at a reduced scale
+    directly in the IDCT, instead of decoding the full frame only to
+    shrink it to 32x32 — a large saving on 1080p+ frames. PNG and other
+    formats decode normally (draft is a JPEG-only hint).
     """
     with Image.open(image_path) as img:
-        return imagehash.phash(img)
+        if img.format == 'JPEG':
+            img.draft('L', (_PHASH_DCT_SIZE * 2, _PHASH_DCT_SIZE * 2))
+        return _phash_input(img)
+
+
+def _hashes_from_inputs(arr: np.ndarray) -> np.ndarray:
+    """Compute 64-bit pHashes from a stacked (N, 32, 32) input array.
+
+    Vectorizes the DCT across all frames as two batched matmuls against
+    the precomputed basis, which is much faster than per-image hashing
+    for long videos.
+    """
+    coeffs = _DCT32 @ arr @ _DCT32.T
+    low_freq = coeffs[:, :_PHASH_HASH_SIZE, :_PHASH_HASH_SIZE].reshape(arr.shape[0], -1)
+
+    # Bit i is set when coefficient i exceeds the per-frame median.
+    # Partial selection of the two middle order statistics replaces the
+    # full sort np.median performs; their mean is the even-length median.
+    mid = low_freq.shape[1] // 2
+    part = np.partition(low_freq, (mid - 1, mid), axis=1)
+    medians = (part[:, mid - 1 : mid] + part[:, mid : mid + 1]) / 2.0
+    bits = (low_freq > medians).astype(np.uint8)
+
+    return np.packbits(bits, axis=1).view('>u8').reshape(-1).astype(np.uint64)
+
+
+def _ahashes_from_inputs(arr: np.ndarray) -> np.ndarray:
+    """Compute 64-bit average hashes from a stacked (N, 32, 32) input array.
+
+    aHash skips the DCT entirely: average-pool to 8x8 and set each bit
+    where the cell exceeds the frame mean. Lower discrimination than
+    pHash, but plenty for comparing adjacent frames of the same video at
+    15 s spacing, and roughly an order of magnitude cheaper.
+    """
+    pool = _PHASH_DCT_SIZE // _PHASH_HASH_SIZE
+    pooled = arr.reshape(
+        arr.shape[0], _PHASH_HASH_SIZE, pool, _PHASH_HASH_SIZE, pool
+    ).mean(axis=(2, 4))
+    bits = (pooled > pooled.mean(axis=(1, 2), keepdims=True)).astype(np.uint8)
+    return np.packbits(bits.reshape(arr.shape[0], -1), axis=1).view('>u8').reshape(-1).astype(np.uint64)
+
+
+def _hash_batch(arr: np.ndarray, algo: str) -> np.ndarray:
+    """Route a stacked (N, 32, 32) input batch to the requested hash."""
+    if algo == 'ahash':
+        return _ahashes_from_inputs(arr)
+    return _hashes_from_inputs(arr)
+
+
+def compute_phash_files(image_paths: list[Path | str], algo: str = 'phash') -> np.ndarray:
+    """Compute 64-bit perceptual hashes for a batch of image files.
+
+    File decode and resize dominate the per-frame hash cost, and Pillow
+    releases the GIL for both, so the load pass is spread across a thread
+    pool (avoiding the pickling overhead a process pool would add). The
+    hash then runs once over the stacked batch.
+
+    Args:
+        image_paths: Paths to image files.
+        algo: Hash algorithm, 'phash' (DCT) or 'ahash' (mean threshold).
+
+    Returns:
+        (N,) uint64 array of hash fingerprints.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        inputs = list(executor.map(_load_phash_input, image_paths))
+    return _hash_batch(np.stack(inputs), algo)
+
 
+class _BKTree:
+    """Burkhard-Keller tree over 64-bit hashes under Hamming distance.
 
-def hash_similarity(hash1: imagehash.ImageHash, hash2: imagehash.ImageHash) -> float:
-    """Compute similarity between two perceptual hashes.
+    Lets the dedup loops ask "is any kept frame within N bits of this
+    hash?" in sublinear time, so a scene that bounces away and back
+    (slide -> speaker -> same slide) is still recognized as a duplicate.
+    Nodes are [hash, children] lists keyed by distance to the parent.
+    """
+
+    __slots__ = ('_root',)
+
+    def __init__(self) -> None:
+        self._root: list | None = None
+
+    def add(self, value: int) -> None:
+        """Insert a hash into the tree."""
+        if self._root is None:
+            self._root = [value, {}]
+            return
+        node = self._root
+        while True:
+            distance = (node[0] ^ value).bit_count()
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [value, {}]
+                return
+            node = child
+
+    def find_within(self, value: int, max_dist: int) -> bool:
+        """Return True if any stored hash is within max_dist bits of value."""
+        if self._root is None:
+            return False
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = (node[0] ^ value).bit_count()
+            if distance <= max_dist:
+                return True
+            children = node[1]
+            # Triangle inequality: only subtrees keyed in
+            # [distance - max_dist, distance + max_dist] can contain a hit.
+            # Nodes rarely have more than a handful of children, so
+            # scanning items beats 2*max_dist+1 speculative dict lookups.
+            if len(children) <= 2 * max_dist:
+                lo = distance - max_dist
+                hi = distance + max_dist
+                for d, child in children.items():
+                    if lo <= d <= hi:
+                        stack.append(child)
+            else:
+                for d in range(distance - max_dist, distance + max_dist + 1):
+                    child = children.get(d)
+                    if child is not None:
+                        stack.append(child)
+        return False
+
+
+def dedup_bit_threshold(dedup_threshold: float) -> int:
+    """Convert a 0-1 similarity threshold to a Hamming-distance bit budget.
+
+    Two 64-bit hashes are "similar" when similarity >= threshold, i.e.
+    popcount(a ^ b) <= (1 - threshold) * 64. Converting once lets the
+    dedup loop compare integer popcounts directly.
 
     Args:
-        hash1: First image hash.
-        hash2: Second image hash.
+        dedup_threshold: Similarity threshold (0.0-1.0).
+
+    Returns:
+        Maximum Hamming distance (in bits) for two hashes to be duplicates.
+    """
+    return int((1.0 - dedup_threshold) * 64)
+
+
+def hash_similarity(hash1: int, hash2: int) -> float:
+    """Compute similarity between two 64-bit integer hashes.
+
+    One XOR plus int.bit_count(), which CPython compiles down to the
+    hardware popcount instruction — no per-bit Python iteration.
+
+    Args:
+        hash1: First 64-bit hash.
+        hash2: Second 64-bit hash.
 
     Returns:
         Similarity score between 0.0 (different) and 1.0 (identical).
     """
-    distance = hash1 - hash2
-    return 1.0 - (distance / 64.0)
+    return 1.0 - ((hash1 ^ hash2).bit_count() / 64.0)
+
+
+def extract_frames_stream(
+    video_path: Path,
+    output_dir: Path,
+    interval: int = 15,
+    max_frames: int | None = None,
+    dedup_threshold: float | None = 0.85,
+    dedup_algo: str = 'phash',
+) -> list[FrameInfo]:
+    """Extract jpg frames by streaming MJPEG from ffmpeg, hashing in memory.
+
+    ffmpeg pipes ffmpeg-encoded JPEG frames to stdout at the target
+    interval; each frame is hashed from the in-memory bytes (draft-mode
+    decode, so only a small fraction of the JPEG is inverse-transformed)
+    and only frames that pass the dedup filter touch disk, written as
+    the piped bytes with no re-encode. The MJPEG intermediate is lossy,
+    so this path only produces jpg output — png extraction goes through
+    the temp-dir path in extract_frames_from_file, where ffmpeg encodes
+    PNG losslessly.
+
+    Args:
+        video_path: Path to the local video file.
+        output_dir: Directory to save extracted frames.
+        interval: Interval between frames in seconds.
+        max_frames: Maximum number of frames to extract.
+        dedup_threshold: Similarity threshold for deduplication (0.0-1.0).
+            Set to None to disable deduplication.
+        dedup_algo: Hash algorithm for dedup, 'phash' or 'ahash'.
+
+    Returns:
+        List of FrameInfo objects with paths and timestamps.
+
+    Raises:
+        FrameExtractionError: If frame extraction fails.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cmd = [
+        'ffmpeg',
+        '-i', str(video_path),
+        '-vf', f'fps=1/{interval}',
+        '-f', 'image2pipe',
+        '-vcodec', 'mjpeg',
+        '-q:v', '2',
+        'pipe:1',
+    ]
+
+    frames: list[FrameInfo] = []
+    kept_hashes = _BKTree()
+    frame_index = 0
+    stream_index = 0
+    max_bits = dedup_bit_threshold(dedup_threshold) if dedup_threshold is not None else 0
+    # Build per-frame paths from a string prefix; Path.__truediv__ reparses
+    # its parts on every call, which shows up in the per-frame loop
+    output_dir_str = os.fspath(output_dir)
+
+    def handle_jpeg(jpeg_bytes: bytes) -> bool:
+        """Hash one piped JPEG; write it out if kept. Returns False to stop."""
+        nonlocal frame_index, stream_index
+
+        timestamp = float(stream_index * interval)
+        stream_index += 1
+
+        if max_frames and len(frames) >= max_frames:
+            return False
+
+        current_hash: int | None = None
+        if dedup_threshold is not None:
+            try:
+                with Image.open(io.BytesIO(jpeg_bytes)) as img:
+                    img.draft('L', (_PHASH_DCT_SIZE * 2, _PHASH_DCT_SIZE * 2))
+                    hash_input = _phash_input(img)
+                current_hash = int(_hash_batch(hash_input[np.newaxis], dedup_algo)[0])
+            except Exception:
+                current_hash = None
+
+            if current_hash is not None:
+                # BK-tree over all kept hashes catches recurring scenes,
+                # not just duplicates of the immediately preceding frame
+                if kept_hashes.find_within(current_hash, max_bits):
+                    return True
+                kept_hashes.add(current_hash)
+
+        # The piped frame is already a -q:v 2 JPEG; write it verbatim
+        final_path = f'{output_dir_str}/frame-{frame_index:04d}.jpg'
+        with open(final_path, 'wb') as out:
+            out.write(jpeg_bytes)
+
+        frames.append(
+            FrameInfo(path=Path(final_path), timestamp=timestamp, phash=current_hash)
+        )
+        frame_index += 1
+        return True
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        raise FrameExtractionError("ffmpeg not found")
+
+    # Watchdog kills ffmpeg if it wedges mid-stream: the blocking stdout
+    # read below would otherwise hang forever. Matches the 10-minute cap
+    # the temp-dir path enforces via communicate(timeout=600).
+    timed_out = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(600, _expire)
+    watchdog.daemon = True
+    watchdog.start()
+
+    try:
+        assert proc.stdout is not None
+        # Split the concatenated MJPEG stream on JPEG end-of-image markers
+        buf = bytearray()
+        running = True
+        while running:
+            chunk = proc.stdout.read(65536)
+            if not chunk:
+                break
+            buf += chunk
+            while True:
+                eoi = buf.find(b'\xff\xd9')
+                if eoi == -1:
+                    break
+                jpeg_bytes = bytes(buf[:eoi + 2])
+                del buf[:eoi + 2]
+                if not handle_jpeg(jpeg_bytes):
+                    running = False
+                    break
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+        proc.wait()
+
+    if timed_out.is_set():
+        raise FrameExtractionError("Frame extraction timed out (10 minutes)")
+
+    # `running` is only cleared when max_frames stopped the loop, in which
+    # case ffmpeg dying of EPIPE is expected; any other nonzero exit
+    # (decode error, corrupt tail) means the frame list is truncated and
+    # must not pass as success
+    if running and proc.returncode != 0:
+        raise FrameExtractionError(
+            f"ffmpeg failed with code {proc.returncode} while streaming frames"
+        )
+
+    if not frames:
+        raise FrameExtractionError("No frames were extracted from video")
+
+    return frames
 
 
 def extract_frames_fast(
@@ -68,11 +425,14 @@ def extract_frames_fast(
     max_frames: int | None = None,
     frame_format: str = 'jpg',
     dedup_threshold: float | None = 0.85,
+    dedup_algo: str = 'phash',
 ) -> list[FrameInfo]:
     """Extract frames using fast keyframe seeking.
 
     Much faster than decode-based extraction for long videos. Seeks to
-    each timestamp independently, snapping to nearest keyframe.
+    each timestamp independently, snapping to nearest keyframe. Seek
+    points are batched into a single ffmpeg invocation (one -ss/-i input
+    and one output per timestamp) to amortize process-spawn overhead.
 
     Args:
         video_path: Path to the local video file.
@@ -83,6 +443,7 @@ def extract_frames_fast(
         frame_format: Output format ('jpg' or 'png').
         dedup_threshold: Similarity threshold for deduplication (0.0-1.0).
             Set to None to disable deduplication.
+        dedup_algo: Hash algorithm for dedup, 'phash' or 'ahash'.
 
     Returns:
         List of FrameInfo objects with paths and timestamps.
@@ -112,65 +473,117 @@ def extract_frames_fast(
         if max_frames and len(timestamps) >= max_frames:
             break
 
-    # Extract frames using seek-based approach
-    frames: list[FrameInfo] = []
-    prev_hash: imagehash.ImageHash | None = None
-    frame_index = 0
-
-    for timestamp in timestamps:
-        # Use -ss before -i for fast input seeking (keyframe-based)
-        temp_path = output_dir / f'_temp_frame.{frame_format}'
-        cmd = [
-            'ffmpeg', '-y',
-            '-ss', str(timestamp),
-            '-i', str(video_path),
-            '-frames:v', '1',
-            '-q:v', '2',
-            str(temp_path),
-        ]
+    # Extract seek batches: one ffmpeg spawn handles up to _SEEK_BATCH_SIZE
+    # timestamps via multiple fast-seeking inputs and mapped outputs.
+    # Per-frame paths are built from a string prefix to avoid repeated
+    # Path.__truediv__ parsing in the loops below.
+    output_dir_str = os.fspath(output_dir)
+    temp_paths: list[tuple[float, str]] = []
+    for batch_start in range(0, len(timestamps), _SEEK_BATCH_SIZE):
+        batch = timestamps[batch_start:batch_start + _SEEK_BATCH_SIZE]
+
+        cmd = ['ffmpeg', '-y']
+        batch_paths: list[tuple[float, str]] = []
+        for timestamp in batch:
+            # Use -ss before -i for fast input seeking (keyframe-based).
+            # -skip_frame nokey makes the decoder discard non-keyframes,
+            # so the seek emits the snapped keyframe directly instead of
+            # decoding forward from it to the exact requested timestamp.
+            cmd.extend(['-skip_frame', 'nokey', '-ss', str(timestamp), '-i', str(video_path)])
+        for j, timestamp in enumerate(batch):
+            temp_path = f'{output_dir_str}/_temp_frame-{batch_start + j:04d}.{frame_format}'
+            cmd.extend(['-map', f'{j}:v', '-frames:v', '1', '-q:v', '2', temp_path])
+            batch_paths.append((timestamp, temp_path))
 
         try:
-            result = subprocess.run(
+            # Output is discarded; DEVNULL avoids pipe allocation and any
+            # risk of ffmpeg blocking on an undrained stderr pipe
+            subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30 * len(batch),
             )
+        except subprocess.TimeoutExpired:
+            pass
+        except Exception:
+            pass
 
-            if result.returncode != 0 or not temp_path.exists():
-                continue  # Skip failed frames
+        # Seeks past EOF (or other per-output failures) simply produce no file
+        temp_paths.extend((ts, p) for ts, p in batch_paths if os.path.exists(p))
 
-        except subprocess.TimeoutExpired:
-            continue
+    # Batch-hash every extracted frame up front: decode spreads across a
+    # thread pool and the transform runs vectorized, which beats hashing
+    # lazily inside the sequential dedup loop on multi-core machines even
+    # though exact duplicates get hashed too
+    hashes: list[int | None] = [None] * len(temp_paths)
+    if dedup_threshold is not None and temp_paths:
+        try:
+            hashed = compute_phash_files([p for _, p in temp_paths], dedup_algo)
+            hashes = [int(h) for h in hashed]
         except Exception:
-            continue
+            pass
+
+    # Dedup pass over extracted frames. Duplicates are collected and
+    # deleted after the loop so unlink syscalls don't interleave with the
+    # hashing work.
+    frames: list[FrameInfo] = []
+    to_delete: list[str] = []
+    kept_hashes = _BKTree()
+    seen_digests: set[tuple[int, bytes]] = set()
+    frame_index = 0
+    max_bits = dedup_bit_threshold(dedup_threshold) if dedup_threshold is not None else 0
 
+    for i, (timestamp, temp_path) in enumerate(temp_paths):
         # Apply deduplication if enabled
+        current_hash: int | None = None
         if dedup_threshold is not None:
+            # Slide-heavy videos produce byte-identical frames, including
+            # non-adjacent recurrences; a set of (size, head-digest) keys
+            # catches them all regardless of the perceptual-hash threshold
             try:
-                current_hash = compute_phash(temp_path)
-            except Exception:
-                current_hash = None
+                digest_key = (os.path.getsize(temp_path), _head_digest(temp_path))
+            except OSError:
+                digest_key = None
 
-            if current_hash is not None and prev_hash is not None:
-                similarity = hash_similarity(prev_hash, current_hash)
-                if similarity >= dedup_threshold:
-                    temp_path.unlink(missing_ok=True)
+            if digest_key is not None:
+                if digest_key in seen_digests:
+                    to_delete.append(temp_path)
                     continue
+                seen_digests.add(digest_key)
 
-            prev_hash = current_hash
+            current_hash = hashes[i]
 
-        # Move to final location
-        final_name = f'frame-{frame_index:04d}.{frame_format}'
-        final_path = output_dir / final_name
-        shutil.move(str(temp_path), str(final_path))
+            if current_hash is not None:
+                if kept_hashes.find_within(current_hash, max_bits):
+                    to_delete.append(temp_path)
+                    continue
+                kept_hashes.add(current_hash)
+
+        # Move to final location; temp frames live in output_dir, so this
+        # is a plain same-filesystem rename(2)
+        final_path = f'{output_dir_str}/frame-{frame_index:04d}.{frame_format}'
+        os.replace(temp_path, final_path)
 
-        frames.append(FrameInfo(path=final_path, timestamp=timestamp))
+        frames.append(
+            FrameInfo(path=Path(final_path), timestamp=timestamp, phash=current_hash)
+        )
         frame_index += 1
 
-    # Clean up any remaining temp file
-    temp_path = output_dir / f'_temp_frame.{frame_format}'
-    temp_path.unlink(missing_ok=True)
+    # Delete duplicates and any remaining temp files in one tight pass
+    for duplicate in to_delete:
+        try:
+            os.remove(duplicate)
+        except OSError:
+            pass
+    leftover_suffix = f'.{frame_format}'
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('_temp_frame-') and entry.name.endswith(leftover_suffix):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
 
     return frames
 
@@ -182,11 +595,21 @@ def extract_frames_from_file(
     max_frames: int | None = None,
     frame_format: str = 'jpg',
     dedup_threshold: float | None = 0.85,
+    dedup_algo: str = 'phash',
+    dedup_in_memory: bool = True,
 ) -> list[FrameInfo]:
     """Extract frames from a local video file with integrated deduplication.
 
-    Extracts frames to a temp directory first, then iterates through them
-    applying perceptual hash deduplication before moving to the final location.
+    When dedup is enabled and the output is jpg, frames are streamed
+    from ffmpeg and hashed in memory so discarded frames never touch
+    disk (see extract_frames_stream). If the streaming pipeline fails —
+    it depends on the mjpeg encoder and the image2pipe muxer, unlike the
+    plain file output below — extraction falls back to the temp-dir
+    path, which extracts frames to a temp directory first and
+    deduplicates them before moving to the final location. The temp-dir
+    path also runs directly for png output (the MJPEG intermediate is
+    lossy, so png frames must be encoded by ffmpeg itself), when dedup
+    is disabled, or when dedup_in_memory is False.
 
     Args:
         video_path: Path to the local video file.
@@ -197,6 +620,10 @@ def extract_frames_from_file(
         dedup_threshold: Similarity threshold for deduplication (0.0-1.0).
             Frames with similarity above this value are removed.
             Set to None to disable deduplication.
+        dedup_algo: Hash algorithm for dedup, 'phash' or 'ahash'.
+        dedup_in_memory: Stream frames through a pipe and hash in memory
+            instead of writing-then-reading temp files; on streaming
+            failure the temp-dir path runs as a fallback.
 
     Returns:
         List of FrameInfo objects with paths and timestamps.
@@ -215,50 +642,83 @@ def extract_frames_from_file(
     if not video_path.exists():
         raise FrameExtractionError(f"Video file not found: {video_path}")
 
+    # Streaming path (jpg only): hash frames in memory, write only kept
+    # frames. png goes through the temp-dir path below so ffmpeg encodes
+    # it losslessly instead of from the lossy MJPEG intermediate.
+    if dedup_in_memory and dedup_threshold is not None and frame_format == 'jpg':
+        try:
+            return extract_frames_stream(
+                video_path,
+                output_dir,
+                interval=interval,
+                max_frames=max_frames,
+                dedup_threshold=dedup_threshold,
+                dedup_algo=dedup_algo,
+            )
+        except FrameExtractionError as e:
+            # A wedged ffmpeg already cost the full deadline; don't pay
+            # it a second time in the fallback
+            if 'timed out' in str(e):
+                raise
+            # Otherwise fall through to the temp-dir extraction below
+
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create temp directory for initial extraction
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Create temp directory for initial extraction inside output_dir, so
+    # promoting kept frames is a same-filesystem rename(2) rather than a
+    # potential copy+unlink from a cross-filesystem $TMPDIR
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
         temp_path = Path(temp_dir)
         temp_pattern = temp_path / f'frame-%04d.{frame_format}'
 
         # Build ffmpeg command
         cmd = ['ffmpeg', '-y', '-i', str(video_path)]
 
-        # Build video filter
-        vf_parts = [f'fps=1/{interval}']
-
-        if max_frames and dedup_threshold is None:
-            # Only apply max_frames in ffmpeg if dedup is disabled
-            # Otherwise we need to extract more to account for duplicates
-            vf_parts.append(f"select='lt(n,{max_frames})'")
-
-        if vf_parts:
-            cmd.extend(['-vf', ','.join(vf_parts)])
-
-        # Output settings
-        cmd.extend([
-            '-vsync', 'vfr',
-            '-frame_pts', '1',
-            str(temp_pattern),
-        ])
+        thumb_size = _PHASH_DCT_SIZE * _PHASH_DCT_SIZE
+        if dedup_threshold is not None:
+            # Single decode, dual consumption: one shared fps+mpdecimate
+            # stage feeds a split whose branches become the full-res file
+            # output and the 32x32 gray thumbnail pipe used for hashing.
+            # mpdecimate drops near-identical sampled frames inside ffmpeg
+            # (SIMD SAD compare) before they are encoded, written, or
+            # hashed, and running it once before the split keeps the two
+            # branches aligned by construction.
+            cmd.extend([
+                '-filter_complex',
+                f'[0:v]fps=1/{interval},mpdecimate,split=2[full][small];'
+                f'[small]scale={_PHASH_DCT_SIZE}:{_PHASH_DCT_SIZE},format=gray[thumb]',
+                '-map', '[full]', '-vsync', 'vfr', '-frame_pts', '1', str(temp_pattern),
+                '-map', '[thumb]', '-f', 'rawvideo', 'pipe:1',
+            ])
+        else:
+            cmd.extend(['-vf', f'fps=1/{interval}', '-vsync', 'vfr', '-frame_pts', '1'])
+            if max_frames:
+                # An output-side frame cap lets ffmpeg stop demuxing and
+                # decoding once the quota is written, unlike a select
+                # filter that keeps consuming the rest of the stream.
+                # (With dedup we extract more to account for duplicates.)
+                cmd.extend(['-frames:v', str(max_frames)])
+            cmd.append(str(temp_pattern))
 
         # Run ffmpeg
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
+            thumb_bytes, stderr_bytes = proc.communicate(timeout=600)
 
-            if result.returncode != 0:
+            if proc.returncode != 0:
                 raise FrameExtractionError(
-                    f"ffmpeg failed with code {result.returncode}:\n{result.stderr}"
+                    f"ffmpeg failed with code {proc.returncode}:\n"
+                    f"{stderr_bytes.decode(errors='replace')}"
                 )
 
         except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
             raise FrameExtractionError("Frame extraction timed out (10 minutes)")
         except FileNotFoundError:
             raise FrameExtractionError("ffmpeg not found")
@@ -267,47 +727,105 @@ def extract_frames_from_file(
         except Exception as e:
             raise FrameExtractionError(f"Frame extraction failed: {e}") from e
 
-        # Collect temp frames
-        temp_frames = sorted(temp_path.glob(f'frame-*.{frame_format}'))
+        # Collect temp frames as plain path strings: scandir avoids the
+        # per-entry Path allocation and fnmatch work of glob, and sorting
+        # the strings orders by name within the one directory
+        suffix = f'.{frame_format}'
+        with os.scandir(temp_path) as entries:
+            temp_frames = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith('frame-') and entry.name.endswith(suffix)
+            ]
+        temp_frames.sort()
 
         if not temp_frames:
             raise FrameExtractionError("No frames were extracted from video")
 
+        # Hash from the piped thumbnails: one vectorized DCT over the
+        # stacked batch, no file re-reads or JPEG decodes
+        hashes: list[int | None] = [None] * len(temp_frames)
+        if dedup_threshold is not None:
+            n_thumbs = len(thumb_bytes) // thumb_size
+            if n_thumbs >= len(temp_frames):
+                thumbs = (
+                    np.frombuffer(thumb_bytes, dtype=np.uint8, count=n_thumbs * thumb_size)
+                    .reshape(n_thumbs, _PHASH_DCT_SIZE, _PHASH_DCT_SIZE)
+                    .astype(np.float32)
+                )
+                batch = _hash_batch(thumbs[: len(temp_frames)], dedup_algo)
+                hashes = [int(h) for h in batch]
+            else:
+                # Thumbnail stream came up short; hash the files instead
+                try:
+                    hashes = [int(h) for h in compute_phash_files(temp_frames, dedup_algo)]
+                except Exception:
+                    # Can't hash; keep all frames
+                    hashes = [None] * len(temp_frames)
+
+        # Precompute adjacent Hamming distances in one NumPy pass: the
+        # common case compares each frame to its immediate predecessor
+        # (which was kept), so most popcounts move out of the interpreter.
+        # The loop falls back to int.bit_count only across skip runs.
+        adjacent_dist: np.ndarray | None = None
+        if dedup_threshold is not None and len(temp_frames) > 1 and hashes[0] is not None:
+            hash_arr = np.array(hashes, dtype=np.uint64)
+            xors = np.bitwise_xor(hash_arr[1:], hash_arr[:-1])
+            adjacent_dist = (
+                _POPCOUNT[xors.view(np.uint8)].reshape(-1, 8).sum(axis=1, dtype=np.intp)
+            )
+
         # Process frames with deduplication
         frames: list[FrameInfo] = []
-        prev_hash: imagehash.ImageHash | None = None
+        kept_hashes = _BKTree()
+        prev_kept_index = -1
         frame_index = 0
+        max_bits = dedup_bit_threshold(dedup_threshold) if dedup_threshold is not None else 0
+        output_dir_str = os.fspath(output_dir)
 
         for i, temp_frame in enumerate(temp_frames):
-            # Calculate timestamp
-            timestamp = float(i * interval)
+            # Timestamp from the pts-based filename number (-frame_pts 1):
+            # mpdecimate leaves gaps in the sequence, so the list index
+            # would drift after any in-decoder drop
+            try:
+                pts_index = int(os.path.basename(temp_frame)[6:-len(suffix)])
+            except ValueError:
+                pts_index = i
+            timestamp = float(pts_index * interval)
 
             # Check max_frames limit
             if max_frames and len(frames) >= max_frames:
                 break
 
-            # Compute hash if dedup is enabled
+            current_hash = hashes[i]
             if dedup_threshold is not None:
-                try:
-                    current_hash = compute_phash(temp_frame)
-                except Exception:
-                    # Can't compute hash, keep the frame anyway
-                    current_hash = None
-
-                if current_hash is not None and prev_hash is not None:
-                    similarity = hash_similarity(prev_hash, current_hash)
-                    if similarity >= dedup_threshold:
+                if current_hash is not None:
+                    # Common case first: the precomputed adjacent distance
+                    # settles duplicates of the immediately preceding kept
+                    # frame without touching the tree
+                    if (
+                        adjacent_dist is not None
+                        and prev_kept_index == i - 1
+                        and int(adjacent_dist[i - 1]) <= max_bits
+                    ):
                         # Too similar, skip this frame
                         continue
+                    # BK-tree over all kept hashes catches scenes that
+                    # bounce away and back
+                    if kept_hashes.find_within(current_hash, max_bits):
+                        continue
+                    kept_hashes.add(current_hash)
 
-                prev_hash = current_hash
+                prev_kept_index = i
 
-            # Move frame to final location with sequential numbering
-            final_name = f'frame-{frame_index:04d}.{frame_format}'
-            final_path = output_dir / final_name
-            shutil.move(str(temp_frame), str(final_path))
+            # Move frame to final location with sequential numbering; the
+            # temp dir sits inside output_dir, so this is a pure rename
+            final_path = f'{output_dir_str}/frame-{frame_index:04d}.{frame_format}'
+            os.replace(temp_frame, final_path)
 
-            frames.append(FrameInfo(path=final_path, timestamp=timestamp))
+            frames.append(
+                FrameInfo(path=Path(final_path), timestamp=timestamp, phash=current_hash)
+            )
             frame_index += 1
 
     return frames
@@ -1,12 +1,13 @@
 """Local video metadata extraction using ffprobe."""
 
 import json
+import os
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from ytcapture.utils import sanitize_title
+from ytcapture.utils import sanitize_title, today_strings
 
 
 class LocalVideoError(Exception):
@@ -65,6 +66,88 @@ class LocalVideoMetadata:
         return 'video'
 
 
+# Bytes scanned at each end of an MP4 file for the moov/mvhd header;
+# moov commonly sits at the front (faststart) or the very end
+_MP4_SCAN_BYTES = 64 * 1024
+
+# Container suffixes eligible for the direct mvhd duration parse
+_MP4_SUFFIXES = {'.mp4', '.m4v', '.mov'}
+
+
+def _find_mvhd(buf: bytes) -> int:
+    """Find a validated 'mvhd' fourcc in buf, returning -1 if absent.
+
+    A raw substring search can hit the byte sequence inside mdat payload
+    (the head of a non-faststart file is mostly media data), which would
+    yield a silently wrong duration. Only trust a match whose preceding
+    four bytes parse as the atom size — mvhd is exactly 108 bytes
+    (version 0) or 120 bytes (version 1) — and whose version byte agrees.
+
+    Args:
+        buf: Raw bytes scanned for the movie header.
+
+    Returns:
+        Offset of the 'mvhd' fourcc, or -1 if no validated match.
+    """
+    pos = buf.find(b'mvhd')
+    while pos != -1:
+        if pos >= 4 and pos + 5 <= len(buf):
+            size = int.from_bytes(buf[pos - 4:pos], 'big')
+            version = buf[pos + 4]
+            if (size, version) in ((108, 0), (120, 1)):
+                return pos
+        pos = buf.find(b'mvhd', pos + 1)
+    return -1
+
+
+def _parse_mp4_duration(video_path: Path) -> float | None:
+    """Read an MP4/MOV duration straight from the mvhd atom.
+
+    The movie header records duration/timescale per ISO/IEC 14496-12 at
+    fixed offsets, so common containers can be parsed in microseconds
+    without spawning ffprobe. Scans the head of the file and then the
+    tail (moov can live at either end).
+
+    Args:
+        video_path: Path to the video file.
+
+    Returns:
+        Duration in seconds, or None if the header can't be parsed.
+    """
+    try:
+        with open(video_path, 'rb') as f:
+            head = f.read(_MP4_SCAN_BYTES)
+            pos = _find_mvhd(head)
+            buf = head
+            if pos == -1:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                if size > len(head):
+                    f.seek(max(size - _MP4_SCAN_BYTES, 0))
+                    buf = f.read(_MP4_SCAN_BYTES)
+                    pos = _find_mvhd(buf)
+        if pos == -1:
+            return None
+
+        # Field offsets relative to the 'mvhd' fourcc: version/flags (4),
+        # then creation/modification times whose width depends on version
+        version = buf[pos + 4]
+        if version == 0:
+            timescale = int.from_bytes(buf[pos + 16:pos + 20], 'big')
+            duration = int.from_bytes(buf[pos + 20:pos + 24], 'big')
+        elif version == 1:
+            timescale = int.from_bytes(buf[pos + 24:pos + 28], 'big')
+            duration = int.from_bytes(buf[pos + 28:pos + 36], 'big')
+        else:
+            return None
+
+        if timescale <= 0 or duration <= 0:
+            return None
+        return duration / timescale
+    except (OSError, IndexError):
+        return None
+
+
 def check_ffprobe() -> bool:
     """Check if ffprobe is available in PATH.
 
@@ -76,11 +159,16 @@ def check_ffprobe() -> bool:
     return shutil.which('ffprobe') is not None
 
 
-def get_local_video_metadata(video_path: Path) -> LocalVideoMetadata:
+def get_local_video_metadata(
+    video_path: Path,
+    stat_result: os.stat_result | None = None,
+) -> LocalVideoMetadata:
     """Extract metadata from a local video file using ffprobe.
 
     Args:
         video_path: Path to the video file.
+        stat_result: Pre-computed os.stat result for the file; skips the
+            existence check and mtime stat when provided.
 
     Returns:
         LocalVideoMetadata object.
@@ -88,9 +176,48 @@ def get_local_video_metadata(video_path: Path) -> LocalVideoMetadata:
     Raises:
         LocalVideoError: If metadata extraction fails.
     """
-    if not video_path.exists():
+    if stat_result is None and not video_path.exists():
         raise LocalVideoError(f"Video file not found: {video_path}")
 
+    # Fast path for MP4-family containers: parse the duration directly
+    # from the container header, skipping the ffprobe process spawn
+    duration: float | None = None
+    if video_path.suffix.lower() in _MP4_SUFFIXES:
+        duration = _parse_mp4_duration(video_path)
+
+    if duration is None:
+        duration = _probe_duration(video_path)
+
+    # Derive title from filename (sanitized)
+    base_title = sanitize_title(video_path.stem)
+
+    # Get creation date from file modification time
+    try:
+        mtime = (stat_result or video_path.stat()).st_mtime
+        creation_date = datetime.fromtimestamp(mtime).strftime('%Y%m%d')
+    except Exception:
+        creation_date = today_strings()[1]
+
+    return LocalVideoMetadata(
+        file_path=video_path,
+        _base_title=base_title,
+        duration=duration,
+        creation_date=creation_date,
+    )
+
+
+def _probe_duration(video_path: Path) -> float:
+    """Extract a video's duration via ffprobe.
+
+    Args:
+        video_path: Path to the video file.
+
+    Returns:
+        Duration in seconds (0.0 if ffprobe reports none).
+
+    Raises:
+        LocalVideoError: If ffprobe is unavailable or fails.
+    """
     if not check_ffprobe():
         raise LocalVideoError(
             "ffprobe not found. Please install ffmpeg:\n"
@@ -125,9 +252,9 @@ def get_local_video_metadata(video_path: Path) -> LocalVideoMetadata:
         # Extract duration
         duration_str = format_info.get('duration', '0')
         try:
-            duration = float(duration_str)
+            return float(duration_str)
         except (ValueError, TypeError):
-            duration = 0.0
+            return 0.0
 
     except subprocess.TimeoutExpired:
         raise LocalVideoError("ffprobe timed out")
@@ -139,20 +266,3 @@ def get_local_video_metadata(video_path: Path) -> LocalVideoMetadata:
         raise
     except Exception as e:
         raise LocalVideoError(f"Unexpected error: {e}") from e
-
-    # Derive title from filename (sanitized)
-    base_title = sanitize_title(video_path.stem)
-
-    # Get creation date from file modification time
-    try:
-        mtime = video_path.stat().st_mtime
-        creation_date = datetime.fromtimestamp(mtime).strftime('%Y%m%d')
-    except Exception:
-        creation_date = datetime.now().strftime('%Y%m%d')
-
-    return LocalVideoMetadata(
-        file_path=video_path,
-        _base_title=base_title,
-        duration=duration,
-        creation_date=creation_date,
-    )
@@ -1,15 +1,20 @@
 """Markdown generation for Obsidian output."""
 
-from datetime import datetime
+import bisect
+import re
 from pathlib import Path
 
-import yaml
-
 from ytcapture.frames import FrameInfo
 from ytcapture.local import LocalVideoMetadata
 from ytcapture.metadata import VideoMetadataProtocol
 from ytcapture.transcript import TranscriptSegment
-from ytcapture.utils import format_date, format_timestamp, sanitize_title, truncate_title_words
+from ytcapture.utils import (
+    format_date,
+    format_timestamp,
+    sanitize_title,
+    today_strings,
+    truncate_title_words,
+)
 
 
 def align_transcript_to_frames(
@@ -36,27 +41,81 @@ def align_transcript_to_frames(
         # No transcript - return frames with empty segments
         return [(frame, []) for frame in frames]
 
+    # Both lists are sorted by time, so a single merge sweep with a
+    # transcript cursor assigns every segment in O(F + T): advance past
+    # segments before the frame's window, then collect until the next
+    # frame's timestamp
     grouped: list[tuple[FrameInfo, list[TranscriptSegment]]] = []
+    n_segments = len(transcript)
+    # Jump the cursor to the first frame's window by binary search, so a
+    # long pre-roll of segments costs O(log T) instead of a linear walk
+    j = bisect.bisect_left(transcript, frames[0].timestamp, key=lambda s: s.start)
 
     for i, frame in enumerate(frames):
-        # Determine the time window for this frame
-        frame_start = frame.timestamp
-        if i + 1 < len(frames):
-            frame_end = frames[i + 1].timestamp
-        else:
-            frame_end = float('inf')
+        frame_end = frames[i + 1].timestamp if i + 1 < len(frames) else float('inf')
+
+        while j < n_segments and transcript[j].start < frame.timestamp:
+            j += 1
 
-        # Collect segments in this time window
-        segments = [
-            s for s in transcript
-            if frame_start <= s.start < frame_end
-        ]
+        lo = j
+        while j < n_segments and transcript[j].start < frame_end:
+            j += 1
 
-        grouped.append((frame, segments))
+        grouped.append((frame, transcript[lo:j]))
 
     return grouped
 
 
+# Values safe to emit as plain YAML scalars: alphanumeric start/end with
+# only benign interior characters. Anything else gets double-quoted.
+_PLAIN_SCALAR_RE = re.compile(r'^[A-Za-z0-9](?:[A-Za-z0-9 _.()/-]*[A-Za-z0-9.)])?$')
+
+# Plain scalars a YAML parser would coerce to bool/null; must be quoted
+_YAML_KEYWORDS = frozenset({'true', 'false', 'yes', 'no', 'on', 'off', 'null', 'none'})
+
+# Plain scalars a YAML parser would coerce to numbers or dates. Signed,
+# dotted, and colon forms already fail the plain-scalar test above, so
+# this only needs the digit-leading ones: decimals, floats, dates, and
+# the YAML 1.1 hex/octal/binary/underscore integer forms (0x1f, 0b101,
+# 1_000) whose letters a digits-only test would miss.
+_NUMERIC_LIKE_RE = re.compile(r'\d[0-9A-Fa-f_.xXbBoO-]*$')
+
+
+def _yaml_scalar(value: str) -> str:
+    """Render a string as a YAML scalar, double-quoting when plain style is unsafe."""
+    if (
+        _PLAIN_SCALAR_RE.match(value)
+        and not _NUMERIC_LIKE_RE.match(value)
+        and value.lower() not in _YAML_KEYWORDS
+    ):
+        return value
+    escaped = (
+        value.replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+        .replace('\t', '\\t')
+    )
+    return f'"{escaped}"'
+
+
+def _emit_frontmatter(frontmatter: dict[str, str | list[str]]) -> str:
+    """Emit the frontmatter dict as YAML.
+
+    The dict has a small fixed shape (string values plus short string
+    lists), so a direct emitter replaces the general-purpose yaml.dump
+    machinery — a measurable win when stamping out frontmatter for
+    every video in a large playlist.
+    """
+    lines: list[str] = []
+    for key, value in frontmatter.items():
+        if isinstance(value, list):
+            lines.append(f'{key}:\n')
+            lines.extend(f'  - {_yaml_scalar(item)}\n' for item in value)
+        else:
+            lines.append(f'{key}: {_yaml_scalar(value)}\n')
+    return ''.join(lines)
+
+
 def generate_frontmatter(
     metadata: VideoMetadataProtocol,
     url: str | None = None,
@@ -73,7 +132,7 @@ def generate_frontmatter(
     # Build frontmatter dict with required fields
     frontmatter: dict[str, str | list[str]] = {
         'title': metadata.title,
-        'created': datetime.now().strftime('%Y-%m-%d'),
+        'created': today_strings()[0],
         'published': format_date(metadata.source_date),
         'tags': [metadata.source_type],
     }
@@ -101,12 +160,7 @@ def generate_frontmatter(
     frontmatter = {k: v for k, v in frontmatter.items() if v}
 
     # Generate YAML
-    yaml_str = yaml.dump(
-        frontmatter,
-        sort_keys=False,
-        allow_unicode=True,
-        default_flow_style=False,
-    )
+    yaml_str = _emit_frontmatter(frontmatter)
 
     return f'---\n{yaml_str}---\n'
 
@@ -124,25 +178,32 @@ def generate_markdown_body(
     Returns:
         Markdown body string.
     """
-    sections = []
+    return ''.join(_markdown_body_parts(grouped_data, identifier))
+
+
+def _markdown_body_parts(
+    grouped_data: list[tuple[FrameInfo, list[TranscriptSegment]]],
+    identifier: str,
+) -> list[str]:
+    """Build the markdown body as a flat list of string fragments.
+
+    Kept as fragments so generate_markdown_file can hand them straight
+    to writelines without materializing the whole document twice.
+    """
+    parts: list[str] = []
 
     for frame, segments in grouped_data:
-        # Timestamp heading
+        # Timestamp heading and frame embed (Obsidian syntax)
         timestamp_str = format_timestamp(frame.timestamp)
-        section = f'\n## {timestamp_str}\n\n'
-
-        # Frame embed (Obsidian syntax)
-        relative_path = f'images/{identifier}/{frame.path.name}'
-        section += f'![[{relative_path}]]\n\n'
+        parts.append(f'\n## {timestamp_str}\n\n![[images/{identifier}/{frame.path.name}]]\n\n')
 
-        # Transcript text for this frame's time window
+        # Transcript text for this frame's time window (list comprehension:
+        # join over a list skips the generator protocol and presizes)
         if segments:
-            text = ' '.join(s.text for s in segments)
-            section += f'{text}\n'
-
-        sections.append(section)
+            text = ' '.join([s.text for s in segments])
+            parts.append(f'{text}\n')
 
-    return ''.join(sections)
+    return parts
 
 
 def generate_frames_only(
@@ -158,16 +219,16 @@ def generate_frames_only(
     Returns:
         Markdown body string.
     """
-    sections = []
-
-    for frame in frames:
-        timestamp_str = format_timestamp(frame.timestamp)
-        relative_path = f'images/{identifier}/{frame.path.name}'
+    return ''.join(_frames_only_parts(frames, identifier))
 
-        section = f'\n## {timestamp_str}\n\n![[{relative_path}]]\n'
-        sections.append(section)
 
-    return ''.join(sections)
+def _frames_only_parts(frames: list[FrameInfo], identifier: str) -> list[str]:
+    """Build the frames-only body as string fragments (see _markdown_body_parts)."""
+    return [
+        f'\n## {format_timestamp(frame.timestamp)}\n\n'
+        f'![[images/{identifier}/{frame.path.name}]]\n'
+        for frame in frames
+    ]
 
 
 def generate_markdown_filename(metadata: VideoMetadataProtocol) -> str:
@@ -234,15 +295,15 @@ def generate_markdown_file(
     # Generate frontmatter
     frontmatter = generate_frontmatter(metadata, url)
 
-    # Generate body
+    # Generate body as fragments, written out below without joining
     if transcript and frames:
         grouped = align_transcript_to_frames(transcript, frames)
-        body = generate_markdown_body(grouped, identifier)
+        body_parts = _markdown_body_parts(grouped, identifier)
     elif frames:
-        body = generate_frames_only(frames, identifier)
+        body_parts = _frames_only_parts(frames, identifier)
     else:
         # No frames or transcript
-        body = '\n*No frames or transcript available.*\n'
+        body_parts = ['\n*No frames or transcript available.*\n']
 
     # Generate video embed (if video was saved)
     video_embed = ''
@@ -251,24 +312,32 @@ def generate_markdown_file(
         relative_video_path = f'videos/{video_path.name}'
         video_embed = f'\n<video src="{relative_video_path}" controls width="100%"></video>\n'
 
-    # Generate description blockquote (first paragraph only)
+    # Generate description blockquote (first paragraph only). Slice off
+    # the first paragraph by boundary index rather than splitting the
+    # whole description into paragraphs that get discarded
     description_section = ''
     if metadata.description:
-        first_para = metadata.description.strip().split('\n\n')[0]
-        desc_lines = first_para.strip().split('\n')
-        desc_blockquote = '\n'.join(f'> {line}' for line in desc_lines if line.strip())
+        description = metadata.description.strip()
+        idx = description.find('\n\n')
+        first_para = description[:idx] if idx >= 0 else description
+        desc_blockquote = '\n'.join(
+            [f'> {line}' for line in first_para.splitlines() if line.strip()]
+        )
         if desc_blockquote:
             description_section = f'\n{desc_blockquote}\n'
 
     # Combine: frontmatter + H1 title + video embed + description + body
     title_heading = f'\n# {metadata.title}\n'
-    content = frontmatter + title_heading + video_embed + description_section + body
+    parts = [frontmatter, title_heading, video_embed, description_section, *body_parts]
 
     # Generate filename
     if filename is None:
         filename = generate_markdown_filename(metadata)
 
     filepath = output_dir / filename
-    filepath.write_text(content, encoding='utf-8')
+    # writelines over the fragments with a large buffer avoids ever
+    # materializing the whole document as a single string
+    with filepath.open('w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(parts)
 
     return filepath
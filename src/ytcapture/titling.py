@@ -2,7 +2,9 @@
 
 import logging
 import os
+import threading
 from dataclasses import dataclass
+from functools import cache
 
 from ytcapture.utils import sanitize_title
 
@@ -33,6 +35,27 @@ _MAX_TOKENS = 60
 _TEMPERATURE = 0.3
 _TIMEOUT = 15.0
 
+# Shared SDK client; constructing one per call would rebuild the httpx
+# connection pool and pay a fresh TLS handshake for every video
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Return the shared Anthropic client, creating it on first use.
+
+    Double-checked locking: concurrent batch workers call this from the
+    per-video thread pool, and only one of them should build the client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import anthropic
+
+                _client = anthropic.Anthropic(timeout=_TIMEOUT)
+    return _client
+
 
 @dataclass
 class TitleResult:
@@ -43,14 +66,13 @@ class TitleResult:
     used_ai: bool
 
 
-def is_ai_titling_available() -> bool:
-    """Check if AI titling is available (anthropic SDK + API key).
+@cache
+def _check_sdk() -> bool:
+    """Probe whether the anthropic SDK is importable (memoized).
 
-    Returns:
-        True if anthropic is importable and ANTHROPIC_API_KEY is set.
+    SDK presence can't change within a process, so the import attempt —
+    which walks sys.path on failure — runs at most once.
     """
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        return False
     try:
         import anthropic  # noqa: F401
 
@@ -59,6 +81,20 @@ def is_ai_titling_available() -> bool:
         return False
 
 
+def is_ai_titling_available() -> bool:
+    """Check if AI titling is available (anthropic SDK + API key).
+
+    The environment lookup stays live (tests and callers may toggle the
+    key); only the import probe is cached.
+
+    Returns:
+        True if anthropic is importable and ANTHROPIC_API_KEY is set.
+    """
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        return False
+    return _check_sdk()
+
+
 def _validate_title(title: str) -> bool:
     """Validate that a generated title meets basic criteria.
 
@@ -68,12 +104,11 @@ def _validate_title(title: str) -> bool:
     Returns:
         True if the title passes validation.
     """
-    words = title.split()
-    if len(words) < 2 or len(words) > 12:
-        return False
+    # Check the O(1) length bounds before paying for the word split
     if len(title) < 10 or len(title) > 150:
         return False
-    return True
+    words = title.split()
+    return 2 <= len(words) <= 12
 
 
 def _clean_title(raw: str) -> str:
@@ -114,12 +149,6 @@ def generate_ai_title(
     Returns:
         TitleResult with the generated or original title.
     """
-    try:
-        import anthropic
-    except ImportError:
-        logger.debug("anthropic SDK not installed, falling back to original title")
-        return TitleResult(ai_title=title, original_title=title, used_ai=False)
-
     user_message = (
         f"Title: {title}\n"
         f"Channel: {channel}\n"
@@ -127,7 +156,12 @@ def generate_ai_title(
     )
 
     try:
-        client = anthropic.Anthropic(timeout=_TIMEOUT)
+        client = _get_client()
+    except ImportError:
+        logger.debug("anthropic SDK not installed, falling back to original title")
+        return TitleResult(ai_title=title, original_title=title, used_ai=False)
+
+    try:
         response = client.messages.create(
             model=_MODEL,
             max_tokens=_MAX_TOKENS,
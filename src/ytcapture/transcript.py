@@ -1,15 +1,20 @@
 """Transcript fetching and parsing using youtube-transcript-api."""
 
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
 from youtube_transcript_api import TranscriptsDisabled, YouTubeTranscriptApi
 
+from ytcapture.utils import json_dumps_bytes
 
-@dataclass
+
+@dataclass(slots=True)
 class TranscriptSegment:
-    """A single segment of a transcript."""
+    """A single segment of a transcript.
+
+    Slots keep per-segment overhead down; long videos produce thousands
+    of these.
+    """
 
     text: str
     start: float
@@ -51,26 +56,26 @@ def get_transcript(
     if not transcript_list:
         return None
 
-    # Separate manual and auto-generated transcripts
-    manual_transcripts = [t for t in transcript_list if not t.is_generated]
-    generated_transcripts = [t for t in transcript_list if t.is_generated]
-
-    transcript = None
-
-    # Try to find transcript in preferred language
-    if prefer_manual:
-        # Try manual first in preferred language
-        for t in manual_transcripts:
-            if t.language_code.startswith(language):
-                transcript = t
-                break
-
-    # Try generated in preferred language if no manual found
+    # Partition manual and auto-generated transcripts in one sweep,
+    # recording the first preferred-language hit of each kind as we go
+    manual_transcripts: list = []
+    generated_transcripts: list = []
+    manual_match = None
+    generated_match = None
+    for t in transcript_list:
+        if t.is_generated:
+            generated_transcripts.append(t)
+            if generated_match is None and t.language_code.startswith(language):
+                generated_match = t
+        else:
+            manual_transcripts.append(t)
+            if manual_match is None and t.language_code.startswith(language):
+                manual_match = t
+
+    # Try manual first in preferred language, then generated
+    transcript = manual_match if prefer_manual else None
     if transcript is None:
-        for t in generated_transcripts:
-            if t.language_code.startswith(language):
-                transcript = t
-                break
+        transcript = generated_match
 
     # Fall back to any manual transcript
     if transcript is None and manual_transcripts:
@@ -87,7 +92,9 @@ def get_transcript(
     if transcript is None:
         return None
 
-    # Fetch and parse the transcript
+    # Fetch and parse the transcript. Empty-text segments (common in
+    # auto-generated tracks) are dropped here once, so alignment,
+    # markdown generation, and JSON serialization never see them.
     try:
         raw_transcript = transcript.fetch()
         return [
@@ -97,6 +104,7 @@ def get_transcript(
                 duration=float(segment.duration),
             )
             for segment in raw_transcript
+            if segment.text.strip()
         ]
     except Exception:
         return None
@@ -112,5 +120,10 @@ def save_transcript_json(
         transcript: List of TranscriptSegment objects.
         path: Path to save the JSON file.
     """
-    data = [asdict(segment) for segment in transcript]
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    # Literal dicts skip the per-call field reflection asdict does, and
+    # serializing straight to bytes avoids a decode/re-encode round trip
+    data = [
+        {'text': s.text, 'start': s.start, 'duration': s.duration}
+        for s in transcript
+    ]
+    path.write_bytes(json_dumps_bytes(data, indent=True))
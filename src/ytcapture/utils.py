@@ -1,9 +1,14 @@
 """Utility functions for ytcapture."""
 
+import json
 import re
-from urllib.parse import parse_qs, urlparse
+from datetime import date, datetime
+from functools import lru_cache
 
-from dateutil import parser as date_parser
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Regex to find YouTube URLs in arbitrary text. Matches http(s) YouTube domains
 # and consumes URL characters up to whitespace or common delimiters.
@@ -12,12 +17,110 @@ _YOUTUBE_URL_RE = re.compile(
     r'[^\s\)\]"\'>,]*'
 )
 
+# Precompiled pattern for the date hot path; calling the compiled
+# pattern's method directly skips the re module's per-call cache lookup
+_YYYYMMDD_RE = re.compile(r'^\d{8}$')
 
+# Single-pass ID extraction; captures the video ID from watch/embed/v
+# paths and youtu.be short links without urlparse/parse_qs allocations
+_VIDEO_ID_RE = re.compile(
+    r'https?://(?:www\.|m\.)?'
+    r'(?:youtube\.com/(?:watch\?(?:[^#\s]*&)?v=|embed/|v/)|youtu\.be/)'
+    r'([A-Za-z0-9_-]+)'
+)
+
+# Playlist IDs appear as a list= query parameter on any YouTube URL shape
+_PLAYLIST_ID_RE = re.compile(r'[?&]list=([A-Za-z0-9_-]+)')
+
+# Translation table mapping invalid filename characters to spaces; a
+# single C-level str.translate pass beats a regex character class
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', ' '))
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize an object to a JSON string, using orjson when available.
+
+    orjson encodes typical payloads several times faster than the stdlib
+    encoder; the stdlib is kept as a fallback since orjson is an optional
+    dependency. Non-JSON types (e.g. pathlib.Path) are serialized via str().
+
+    Args:
+        obj: Object to serialize.
+        indent: If True, pretty-print with 2-space indentation.
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str)
+
+
+def json_dumps_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes (see json_dumps).
+
+    orjson produces bytes natively, so callers writing to disk can skip
+    the decode/re-encode round trip json_dumps would add.
+
+    Args:
+        obj: Object to serialize.
+        indent: If True, pretty-print with 2-space indentation.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=str)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def json_loads(data: str | bytes):
+    """Deserialize a JSON string, using orjson when available (see json_dumps).
+
+    Args:
+        data: JSON text to parse.
+
+    Returns:
+        The deserialized object.
+
+    Raises:
+        ValueError: If the input is not valid JSON (both parsers raise
+            ValueError subclasses).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _today(ordinal: int) -> tuple[str, str]:
+    """Format a day ordinal as (YYYY-MM-DD, YYYYMMDD) strings."""
+    d = date.fromordinal(ordinal)
+    return d.isoformat(), d.strftime('%Y%m%d')
+
+
+def today_strings() -> tuple[str, str]:
+    """Return today's date as (YYYY-MM-DD, YYYYMMDD) strings.
+
+    Cached per calendar day: batch playlist runs stamp every generated
+    file with the same date, so the strftime work happens once rather
+    than twice per video.
+
+    Returns:
+        Tuple of (ISO date, compact date) for today.
+    """
+    return _today(date.today().toordinal())
+
+
+@lru_cache(maxsize=1024)
 def sanitize_title(title: str, max_length: int = 100) -> str:
     """Sanitize a title for use as a filename.
 
     Removes invalid filename characters and truncates to max_length.
     Preserves original casing (important for acronyms, etc.).
+    Memoized: the same titles and authors recur across batch runs.
 
     Args:
         title: The original title string.
@@ -27,10 +130,11 @@ def sanitize_title(title: str, max_length: int = 100) -> str:
         A sanitized string safe for filenames.
     """
     # Remove invalid filename characters: < > : " / \ | ? *
-    sanitized = re.sub(r'[<>:"/\\|?*]', ' ', title)
+    sanitized = title.translate(_SANITIZE_TABLE)
 
-    # Collapse multiple spaces into one
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+    # Collapse whitespace runs and strip the ends; split/join does both
+    # in C without regex state-machine overhead
+    sanitized = ' '.join(sanitized.split())
 
     # Truncate if too long
     if len(sanitized) > max_length:
@@ -39,8 +143,9 @@ def sanitize_title(title: str, max_length: int = 100) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=1024)
 def truncate_title_words(title: str, max_words: int = 6) -> str:
-    """Truncate title to first N words.
+    """Truncate title to first N words. Memoized like sanitize_title.
 
     Args:
         title: The title string.
@@ -64,15 +169,17 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted string in HH:MM:SS format.
     """
-    total_seconds = int(seconds)
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
+    # divmod computes quotient and remainder in one operation; called
+    # once per frame in the markdown-body loop
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+@lru_cache(maxsize=1024)
 def format_date(date_str: str | None) -> str:
-    """Parse a date string and return YYYY-MM-DD format.
+    """Parse a date string and return YYYY-MM-DD format. Memoized; the
+    dateutil fallback parse is comparatively expensive for repeat inputs.
 
     Args:
         date_str: A date string in various formats (e.g., "20241215", ISO 8601).
@@ -85,19 +192,33 @@ def format_date(date_str: str | None) -> str:
 
     try:
         # Handle yt-dlp format: YYYYMMDD
-        if re.match(r'^\d{8}$', date_str):
+        if _YYYYMMDD_RE.match(date_str):
             return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
 
-        # Parse other formats using dateutil
+        # Most other sources emit ISO 8601; fromisoformat parses it in C,
+        # skipping dateutil's format heuristics
+        try:
+            return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
+        # Parse remaining formats using dateutil (imported lazily so the
+        # common paths never pay its import cost)
+        from dateutil import parser as date_parser
+
         parsed = date_parser.parse(date_str)
         return parsed.strftime("%Y-%m-%d")
     except (ValueError, TypeError):
         return ""
 
 
+@lru_cache(maxsize=4096)
 def extract_video_id(url: str) -> str | None:
     """Extract YouTube video ID from various URL formats.
 
+    Memoized: the same URL is re-parsed by classification, caching, and
+    per-video processing within one run.
+
     Supports:
     - https://www.youtube.com/watch?v=VIDEO_ID
     - https://youtu.be/VIDEO_ID
@@ -110,32 +231,16 @@ def extract_video_id(url: str) -> str | None:
     Returns:
         The video ID string, or None if extraction fails.
     """
-    parsed = urlparse(url)
-
-    # youtu.be/VIDEO_ID
-    if parsed.netloc in ('youtu.be', 'www.youtu.be'):
-        return parsed.path.lstrip('/')
-
-    # youtube.com formats
-    if parsed.netloc in ('youtube.com', 'www.youtube.com', 'm.youtube.com'):
-        # /watch?v=VIDEO_ID
-        if parsed.path == '/watch':
-            query = parse_qs(parsed.query)
-            if 'v' in query:
-                return query['v'][0]
-
-        # /embed/VIDEO_ID or /v/VIDEO_ID
-        if parsed.path.startswith(('/embed/', '/v/')):
-            parts = parsed.path.split('/')
-            if len(parts) >= 3:
-                return parts[2]
-
-    return None
+    m = _VIDEO_ID_RE.match(url)
+    return m.group(1) if m else None
 
 
+@lru_cache(maxsize=4096)
 def extract_playlist_id(url: str) -> str | None:
     """Extract YouTube playlist ID from various URL formats.
 
+    Memoized (see extract_video_id).
+
     Supports:
     - https://www.youtube.com/playlist?list=PLAYLIST_ID
     - https://www.youtube.com/watch?v=VIDEO_ID&list=PLAYLIST_ID
@@ -147,16 +252,17 @@ def extract_playlist_id(url: str) -> str | None:
     Returns:
         The playlist ID string, or None if not a playlist URL.
     """
-    parsed = urlparse(url)
-    query = parse_qs(parsed.query)
-    if 'list' in query:
-        return query['list'][0]
-    return None
+    m = _PLAYLIST_ID_RE.search(url)
+    return m.group(1) if m else None
 
 
+@lru_cache(maxsize=4096)
 def is_video_url(url: str) -> bool:
     """Check if URL is a YouTube video URL.
 
+    Results are memoized since the same URL strings are re-checked during
+    classification and dedup of large pasted lists.
+
     Args:
         url: A URL to check.
 
@@ -166,11 +272,13 @@ def is_video_url(url: str) -> bool:
     return extract_video_id(url) is not None
 
 
+@lru_cache(maxsize=4096)
 def is_playlist_url(url: str) -> bool:
     """Check if URL is a YouTube playlist URL (without a video ID).
 
     Only returns True for pure playlist URLs like /playlist?list=X.
     URLs with both video ID and playlist (e.g., watch?v=X&list=Y) return False.
+    Results are memoized (see is_video_url).
 
     Args:
         url: A URL to check.
@@ -184,6 +292,25 @@ def is_playlist_url(url: str) -> bool:
     return extract_playlist_id(url) is not None
 
 
+def classify_url(url: str) -> str:
+    """Classify a URL as a video, playlist, or invalid URL.
+
+    Performs the video/playlist checks once so callers don't re-run URL
+    parsing for each predicate.
+
+    Args:
+        url: A URL to classify.
+
+    Returns:
+        One of 'video', 'playlist', or 'invalid'.
+    """
+    if is_video_url(url):
+        return 'video'
+    if is_playlist_url(url):
+        return 'playlist'
+    return 'invalid'
+
+
 def extract_youtube_urls(text: str) -> list[str]:
     """Extract all YouTube video and playlist URLs from arbitrary text.
 
@@ -1,19 +1,23 @@
 """Video metadata extraction and download using yt-dlp."""
 
-import json
+import os
+import re
 import subprocess
+import threading
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
-from ytcapture.utils import extract_video_id
+from ytcapture.utils import extract_video_id, json_loads
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMetadata:
     """Metadata extracted from a YouTube video.
 
     Implements VideoMetadataProtocol for compatibility with generic
-    markdown generation.
+    markdown generation. Slots drop the per-instance __dict__, which
+    matters when playlist prefetch holds one instance per video.
     """
 
     video_id: str
@@ -51,6 +55,103 @@ class VideoError(Exception):
     pass
 
 
+# Known yt-dlp failure markers mapped to user-facing messages; one regex
+# alternation scans stderr once instead of a substring search per marker
+_FAILURE_MESSAGES = {
+    'Private video': 'Video is private',
+    'Video unavailable': 'Video is unavailable',
+    'Sign in': 'Video requires authentication',
+}
+_FAILURE_RE = re.compile('|'.join(map(re.escape, _FAILURE_MESSAGES)))
+
+
+def _failure_error(error_msg: str, url: str, fallback: str) -> VideoError:
+    """Build a VideoError from yt-dlp stderr output.
+
+    Args:
+        error_msg: Captured stderr from the failed yt-dlp run.
+        url: The video URL, included in recognized-failure messages.
+        fallback: Message prefix when no known marker matches.
+
+    Returns:
+        VideoError with a classified or fallback message.
+    """
+    m = _FAILURE_RE.search(error_msg)
+    if m:
+        return VideoError(f"{_FAILURE_MESSAGES[m.group(0)]}: {url}")
+    return VideoError(f"{fallback}: {error_msg}")
+
+
+def _stream_json_lines(cmd: list[str], handle_info, timeout: float) -> tuple[int, str]:
+    """Run cmd, feeding each parsed NDJSON stdout line to handle_info.
+
+    Two pieces of plumbing keep the streaming read safe: stderr is
+    drained on a side thread, so a chatty yt-dlp cannot fill that pipe
+    and deadlock against our stdout loop, and a watchdog timer kills the
+    process when the wall-clock deadline passes — a wait() timeout alone
+    would not start counting until stdout hit EOF, so a stall mid-stream
+    would block the read loop forever.
+
+    Args:
+        cmd: Command to run (yt-dlp with --dump-json output).
+        handle_info: Callback invoked with each parsed JSON object.
+            Blank and malformed lines are skipped.
+        timeout: Wall-clock deadline in seconds.
+
+    Returns:
+        Tuple of (returncode, captured stderr text).
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passed and the
+            process was killed.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1 << 16,
+    )
+
+    assert proc.stdout is not None and proc.stderr is not None
+    stderr_parts: list[str] = []
+    drain = threading.Thread(
+        target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True
+    )
+    drain.start()
+
+    timed_out = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, _expire)
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        for line in proc.stdout:
+            if not line.strip():
+                continue
+            try:
+                info = json_loads(line)
+            except ValueError:
+                continue  # Skip malformed entries
+            handle_info(info)
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        watchdog.cancel()
+
+    returncode = proc.wait()
+    drain.join()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode, stderr_parts[0] if stderr_parts else ''
+
+
 def get_video_metadata(url: str) -> VideoMetadata:
     """Extract metadata from a YouTube video.
 
@@ -83,16 +184,9 @@ def get_video_metadata(url: str) -> VideoMetadata:
         )
 
         if result.returncode != 0:
-            error_msg = result.stderr
-            if 'Private video' in error_msg:
-                raise VideoError(f"Video is private: {url}")
-            if 'Video unavailable' in error_msg:
-                raise VideoError(f"Video is unavailable: {url}")
-            if 'Sign in' in error_msg:
-                raise VideoError(f"Video requires authentication: {url}")
-            raise VideoError(f"Failed to get video metadata: {error_msg}")
+            raise _failure_error(result.stderr, url, "Failed to get video metadata")
 
-        info = json.loads(result.stdout)
+        info = json_loads(result.stdout)
         video_id = extract_video_id(url) or info.get('id', '')
 
         return VideoMetadata(
@@ -106,7 +200,7 @@ def get_video_metadata(url: str) -> VideoMetadata:
 
     except subprocess.TimeoutExpired:
         raise VideoError("Metadata extraction timed out")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise VideoError(f"Failed to parse video metadata: {e}") from e
     except FileNotFoundError:
         raise VideoError(
@@ -118,19 +212,97 @@ def get_video_metadata(url: str) -> VideoMetadata:
         raise VideoError(f"Unexpected error getting metadata: {e}") from e
 
 
-def get_stream_url(url: str) -> str:
-    """Get the direct stream URL for a YouTube video (video stream only).
+def get_video_metadata_batch(urls: list[str]) -> dict[str, VideoMetadata]:
+    """Extract metadata for several videos with one yt-dlp invocation.
 
-    Uses yt-dlp CLI for better JS challenge handling.
+    yt-dlp accepts multiple URLs and emits one JSON object per line, so
+    a batch pays interpreter startup once instead of once per video.
+    Videos that fail to resolve are skipped (--ignore-errors) and simply
+    absent from the result.
+
+    Args:
+        urls: YouTube video URLs.
+
+    Returns:
+        Dict mapping each input URL to its VideoMetadata, for URLs that
+        resolved successfully.
+
+    Raises:
+        VideoError: If yt-dlp is missing or the batch produces no output.
+    """
+    if not urls:
+        return {}
+
+    cmd = [
+        'yt-dlp',
+        '--dump-json',
+        '--skip-download',
+        '--no-warnings',
+        '--ignore-errors',
+        '--remote-components', 'ejs:github',
+        *urls,
+    ]
+
+    # Map video IDs back to the caller's URL strings
+    id_to_url = {extract_video_id(u): u for u in urls}
+
+    metas: dict[str, VideoMetadata] = {}
+
+    def _collect(info: dict) -> None:
+        video_id = info.get('id', '')
+        url = id_to_url.get(video_id)
+        if url is None:
+            return
+        metas[url] = VideoMetadata(
+            video_id=video_id,
+            title=info.get('title', 'Untitled'),
+            channel=info.get('channel', info.get('uploader', 'Unknown')),
+            upload_date=info.get('upload_date', ''),
+            description=info.get('description', ''),
+            duration=float(info.get('duration', 0)),
+        )
+
+    try:
+        # Stream the per-video JSON lines as yt-dlp emits them instead of
+        # buffering every full info blob (~200KB each) before parsing
+        returncode, error_msg = _stream_json_lines(
+            cmd, _collect, timeout=60 + 30 * len(urls)
+        )
+
+        if not metas and returncode != 0:
+            raise VideoError(f"Failed to get video metadata: {error_msg}")
+
+        return metas
+
+    except subprocess.TimeoutExpired:
+        raise VideoError("Metadata extraction timed out")
+    except FileNotFoundError:
+        raise VideoError(
+            "yt-dlp not found. Please install yt-dlp:\n"
+            "  pip install yt-dlp\n"
+            "  or: brew install yt-dlp"
+        )
+    except VideoError:
+        raise
+    except Exception as e:
+        raise VideoError(f"Unexpected error getting metadata: {e}") from e
+
+
+def get_video_info(url: str) -> tuple[VideoMetadata, str]:
+    """Extract metadata and the direct stream URL in one yt-dlp call.
+
+    --dump-json with a format selection already includes the resolved
+    stream URL, so callers needing both pay one process spawn instead of
+    two (startup dominates these calls).
 
     Args:
         url: YouTube video URL.
 
     Returns:
-        Direct URL to the video stream.
+        Tuple of (VideoMetadata, direct stream URL).
 
     Raises:
-        VideoError: If stream URL cannot be obtained.
+        VideoError: If the video is unavailable or extraction fails.
     """
     # Format spec targeting 360p-480p for fast processing
     format_spec = 'bestvideo[height<=480][ext=mp4]/bestvideo[height<=480]/18/best'
@@ -138,7 +310,8 @@ def get_stream_url(url: str) -> str:
     cmd = [
         'yt-dlp',
         '--format', format_spec,
-        '--get-url',
+        '--dump-json',
+        '--skip-download',
         '--no-warnings',
         '--remote-components', 'ejs:github',
         url,
@@ -153,20 +326,60 @@ def get_stream_url(url: str) -> str:
         )
 
         if result.returncode != 0:
-            raise VideoError(f"Failed to get stream URL: {result.stderr}")
+            raise _failure_error(result.stderr, url, "Failed to get video info")
+
+        info = json_loads(result.stdout)
+        video_id = extract_video_id(url) or info.get('id', '')
 
-        stream_url = result.stdout.strip()
+        metadata = VideoMetadata(
+            video_id=video_id,
+            title=info.get('title', 'Untitled'),
+            channel=info.get('channel', info.get('uploader', 'Unknown')),
+            upload_date=info.get('upload_date', ''),
+            description=info.get('description', ''),
+            duration=float(info.get('duration', 0)),
+        )
+
+        # Single-format selections carry a top-level url; merged selections
+        # expose the component URLs under requested_formats
+        stream_url = info.get('url', '')
+        if not stream_url:
+            requested = info.get('requested_formats') or []
+            if requested:
+                stream_url = requested[0].get('url', '')
         if not stream_url:
             raise VideoError("No stream URL returned")
 
-        return stream_url
+        return metadata, stream_url
 
     except subprocess.TimeoutExpired:
-        raise VideoError("Stream URL extraction timed out")
+        raise VideoError("Video info extraction timed out")
+    except ValueError as e:
+        raise VideoError(f"Failed to parse video info: {e}") from e
     except FileNotFoundError:
         raise VideoError("yt-dlp not found. Please install yt-dlp.")
+    except VideoError:
+        raise
     except Exception as e:
-        raise VideoError(f"Unexpected error getting stream URL: {e}") from e
+        raise VideoError(f"Unexpected error getting video info: {e}") from e
+
+
+def get_stream_url(url: str) -> str:
+    """Get the direct stream URL for a YouTube video (video stream only).
+
+    Thin wrapper over get_video_info; callers needing metadata too
+    should call get_video_info directly and avoid the second spawn.
+
+    Args:
+        url: YouTube video URL.
+
+    Returns:
+        Direct URL to the video stream.
+
+    Raises:
+        VideoError: If stream URL cannot be obtained.
+    """
+    return get_video_info(url)[1]
 
 
 def download_video(url: str, output_dir: Path) -> Path:
@@ -212,26 +425,22 @@ def download_video(url: str, output_dir: Path) -> Path:
         )
 
         if result.returncode != 0:
-            error_msg = result.stderr
-            if 'Private video' in error_msg:
-                raise VideoError(f"Video is private: {url}")
-            if 'Video unavailable' in error_msg:
-                raise VideoError(f"Video is unavailable: {url}")
-            if 'Sign in' in error_msg:
-                raise VideoError(f"Video requires authentication: {url}")
-            raise VideoError(f"Failed to download video: {error_msg}")
-
-        # Find the downloaded file
-        video_files = list(output_dir.glob('*.mp4'))
-        if not video_files:
-            video_files = list(output_dir.glob('*.webm'))
-        if not video_files:
-            video_files = list(output_dir.glob('*.mkv'))
-
-        if not video_files:
+            raise _failure_error(result.stderr, url, "Failed to download video")
+
+        # Find the downloaded file with a single directory scan
+        # (mp4 preferred, then webm, then mkv)
+        found: dict[str, Path] = {}
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                ext = os.path.splitext(entry.name)[1]
+                if ext in ('.mp4', '.webm', '.mkv') and ext not in found:
+                    found[ext] = Path(entry.path)
+
+        video_file = found.get('.mp4') or found.get('.webm') or found.get('.mkv')
+        if video_file is None:
             raise VideoError("Download completed but no video file found")
 
-        return video_files[0]
+        return video_file
 
     except subprocess.TimeoutExpired:
         raise VideoError("Video download timed out (10 minute limit)")
@@ -247,10 +456,13 @@ def download_video(url: str, output_dir: Path) -> Path:
         raise VideoError(f"Unexpected error downloading video: {e}") from e
 
 
+@cache
 def expand_playlist(url: str) -> list[str]:
     """Expand a YouTube playlist URL to a list of video URLs.
 
     Uses yt-dlp with --flat-playlist to get video entries without downloading.
+    Results are memoized per process so the same playlist URL appearing
+    twice in one invocation is only fetched once.
 
     Args:
         url: A YouTube playlist URL.
@@ -270,36 +482,28 @@ def expand_playlist(url: str) -> list[str]:
         url,
     ]
 
+    # --flat-playlist outputs one JSON object per line (NDJSON)
+    video_urls: list[str] = []
+
+    def _collect(entry: dict) -> None:
+        # Each entry has 'id' and optionally 'url'
+        video_id = entry.get('id')
+        if video_id:
+            video_urls.append(f"https://www.youtube.com/watch?v={video_id}")
+
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,  # 2 minute timeout for playlist metadata
-        )
+        # Stream the NDJSON output line by line instead of buffering the
+        # whole dump; thousand-entry playlists never materialize in memory.
+        # 2 minute wall-clock cap for playlist metadata.
+        returncode, error_msg = _stream_json_lines(cmd, _collect, timeout=120)
 
-        if result.returncode != 0:
-            error_msg = result.stderr
+        if returncode != 0:
             if 'Private' in error_msg:
                 raise VideoError(f"Playlist is private: {url}")
             if 'not exist' in error_msg or 'unavailable' in error_msg.lower():
                 raise VideoError(f"Playlist not found: {url}")
             raise VideoError(f"Failed to expand playlist: {error_msg}")
 
-        # --flat-playlist outputs one JSON object per line (NDJSON)
-        video_urls: list[str] = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                # Each entry has 'id' and optionally 'url'
-                video_id = entry.get('id')
-                if video_id:
-                    video_urls.append(f"https://www.youtube.com/watch?v={video_id}")
-            except json.JSONDecodeError:
-                continue  # Skip malformed entries
-
         return video_urls
 
     except subprocess.TimeoutExpired:
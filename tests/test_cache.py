@@ -0,0 +1,79 @@
+"""Tests for the on-disk metadata/transcript cache."""
+
+import json
+import time
+
+from ytcapture.cache import cache_get, cache_set, clear_cache
+
+
+class TestCacheRoundTrip:
+    """Tests for cache_get() / cache_set()."""
+
+    def test_set_then_get(self, tmp_path):
+        path = tmp_path / "meta.json"
+        cache_set("metadata", "abc123", {"title": "Test"}, path=path)
+        assert cache_get("metadata", "abc123", path=path) == {"title": "Test"}
+
+    def test_missing_entry_returns_none(self, tmp_path):
+        path = tmp_path / "meta.json"
+        assert cache_get("metadata", "nope", path=path) is None
+
+    def test_kinds_are_namespaced(self, tmp_path):
+        path = tmp_path / "meta.json"
+        cache_set("metadata", "abc123", {"title": "Test"}, path=path)
+        assert cache_get("transcript", "abc123", path=path) is None
+
+    def test_stale_entry_returns_none(self, tmp_path):
+        path = tmp_path / "meta.json"
+        cache_set("metadata", "abc123", {"title": "Test"}, path=path)
+        # Rewrite the entry with an old timestamp
+        data = json.loads(path.read_text())
+        data["metadata:abc123"]["timestamp"] = time.time() - 100000
+        path.write_text(json.dumps(data))
+        assert cache_get("metadata", "abc123", ttl=86400, path=path) is None
+
+    def test_corrupt_cache_file_ignored(self, tmp_path):
+        path = tmp_path / "meta.json"
+        path.write_text("not json {{{")
+        assert cache_get("metadata", "abc123", path=path) is None
+        # Writing should recover from the corrupt file
+        cache_set("metadata", "abc123", {"title": "Test"}, path=path)
+        assert cache_get("metadata", "abc123", path=path) == {"title": "Test"}
+
+
+class TestClearCache:
+    """Tests for clear_cache()."""
+
+    def test_clear_removes_file(self, tmp_path):
+        path = tmp_path / "meta.json"
+        cache_set("metadata", "abc123", {"title": "Test"}, path=path)
+        clear_cache(path=path)
+        assert not path.exists()
+
+    def test_clear_missing_file_is_noop(self, tmp_path):
+        clear_cache(path=tmp_path / "meta.json")
+
+
+class TestCacheCommand:
+    """Tests for the cache subcommand handler."""
+
+    def test_clear(self, tmp_path, monkeypatch):
+        from ytcapture import cache as cache_mod
+
+        path = tmp_path / "meta.json"
+        monkeypatch.setattr(cache_mod, "get_cache_path", lambda: path)
+        cache_set("metadata", "abc123", {"title": "Test"}, path=path)
+        assert cache_mod.cache_command("ytcapture", ["clear"]) == 0
+        assert not path.exists()
+
+    def test_path(self, capsys):
+        from ytcapture.cache import cache_command, get_cache_path
+
+        assert cache_command("ytcapture", ["path"]) == 0
+        assert capsys.readouterr().out.strip() == str(get_cache_path())
+
+    def test_unknown_action_errors(self):
+        from ytcapture.cache import cache_command
+
+        assert cache_command("ytcapture", ["nuke"]) == 1
+        assert cache_command("ytcapture", []) == 1
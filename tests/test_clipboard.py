@@ -181,53 +181,56 @@ class TestGetClipboardUrls:
 class TestConfirmClipboardUrls:
     """Tests for preview_urls() with clipboard source."""
 
-    @patch("ytcapture.cli.click.confirm", return_value=True)
-    @patch("ytcapture.cli.get_video_metadata")
-    def test_confirm_accepted(self, mock_metadata, mock_confirm):
-        from rich.console import Console
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch):
+        """Point the metadata cache at a throwaway file for each test."""
+        monkeypatch.setattr(
+            "ytcapture.cache.get_cache_path", lambda: tmp_path / "meta.json"
+        )
 
-        from ytcapture.cli import preview_urls
+    @staticmethod
+    def _metadata_for(url):
+        from ytcapture.utils import extract_video_id
         from ytcapture.video import VideoMetadata
 
-        mock_metadata.return_value = VideoMetadata(
-            video_id="abc123",
+        return VideoMetadata(
+            video_id=extract_video_id(url),
             title="Test Video",
             channel="Test Channel",
             upload_date="20240101",
             description="Test",
             duration=120.0,
         )
+
+    @patch("ytcapture.cli.click.confirm", return_value=True)
+    @patch("ytcapture.video.get_video_metadata_batch")
+    def test_confirm_accepted(self, mock_metadata, mock_confirm):
+        from rich.console import Console
+
+        from ytcapture.cli import preview_urls
+
+        url = "https://www.youtube.com/watch?v=abc123"
+        mock_metadata.return_value = {url: self._metadata_for(url)}
         con = Console(quiet=True)
-        result = preview_urls(
-            ["https://www.youtube.com/watch?v=abc123"], con, source="clipboard"
-        )
+        result = preview_urls([url], con, source="clipboard")
         assert result is True
         mock_confirm.assert_called_once_with("Proceed with capture?", default=True)
 
     @patch("ytcapture.cli.click.confirm", return_value=False)
-    @patch("ytcapture.cli.get_video_metadata")
+    @patch("ytcapture.video.get_video_metadata_batch")
     def test_confirm_rejected(self, mock_metadata, mock_confirm):
         from rich.console import Console
 
         from ytcapture.cli import preview_urls
-        from ytcapture.video import VideoMetadata
 
-        mock_metadata.return_value = VideoMetadata(
-            video_id="abc123",
-            title="Test Video",
-            channel="Test Channel",
-            upload_date="20240101",
-            description="Test",
-            duration=120.0,
-        )
+        url = "https://www.youtube.com/watch?v=abc123"
+        mock_metadata.return_value = {url: self._metadata_for(url)}
         con = Console(quiet=True)
-        result = preview_urls(
-            ["https://www.youtube.com/watch?v=abc123"], con, source="clipboard"
-        )
+        result = preview_urls([url], con, source="clipboard")
         assert result is False
 
     @patch("ytcapture.cli.click.confirm", return_value=True)
-    @patch("ytcapture.cli.get_video_metadata")
+    @patch("ytcapture.video.get_video_metadata_batch")
     def test_metadata_unavailable(self, mock_metadata, mock_confirm):
         from rich.console import Console
 
@@ -242,27 +245,20 @@ class TestConfirmClipboardUrls:
         assert result is True
 
     @patch("ytcapture.cli.click.confirm", return_value=True)
-    @patch("ytcapture.cli.get_video_metadata")
+    @patch("ytcapture.video.get_video_metadata_batch")
     def test_multiple_urls(self, mock_metadata, mock_confirm):
         from rich.console import Console
 
         from ytcapture.cli import preview_urls
-        from ytcapture.video import VideoMetadata
 
-        mock_metadata.return_value = VideoMetadata(
-            video_id="abc123",
-            title="Test Video",
-            channel="Test Channel",
-            upload_date="20240101",
-            description="Test",
-            duration=60.0,
-        )
-        con = Console(quiet=True)
         urls = [
             "https://www.youtube.com/watch?v=abc123",
             "https://www.youtube.com/watch?v=def456",
             "https://www.youtube.com/watch?v=ghi789",
         ]
-        result = preview_urls(urls, con, source="clipboard")
+        mock_metadata.side_effect = lambda batch: {u: self._metadata_for(u) for u in batch}
+        result = preview_urls(urls, Console(quiet=True), source="clipboard")
         assert result is True
-        assert mock_metadata.call_count == 3
+        # Three URLs fit in a single yt-dlp batch
+        assert mock_metadata.call_count == 1
+        assert mock_metadata.call_args[0][0] == urls
@@ -18,6 +18,15 @@ from ytcapture.titling import (
 class TestIsAiTitlingAvailable:
     """Tests for is_ai_titling_available()."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_sdk_probe(self):
+        """Clear the memoized SDK import probe around each test."""
+        from ytcapture.titling import _check_sdk
+
+        _check_sdk.cache_clear()
+        yield
+        _check_sdk.cache_clear()
+
     def test_available_with_sdk_and_key(self):
         """Available when both SDK and key are present."""
         mock_anthropic = MagicMock()
@@ -121,6 +130,15 @@ class TestValidateTitle:
 class TestGenerateAiTitle:
     """Tests for generate_ai_title()."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_client(self):
+        """Clear the cached SDK client so each test's mock module is used."""
+        import ytcapture.titling as titling
+
+        titling._client = None
+        yield
+        titling._client = None
+
     def test_successful_generation(self):
         """Successful API call produces a valid AI title."""
         mock_module, mock_client = _make_mock_anthropic(